@@ -1,8 +1,16 @@
 """Jackfield Labeler - A professional desktop application for creating custom label strips."""
 
-try:
-    from importlib import metadata
 
-    __version__ = metadata.version("jackfield-labeler")
-except ImportError:
-    __version__ = "0.0.0"
+def __getattr__(name: str) -> str:
+    """Resolve __version__ lazily so the importlib.metadata scan is only paid on first access."""
+    if name == "__version__":
+        try:
+            from importlib import metadata
+
+            version = metadata.version("jackfield-labeler")
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Fall back when the package is not installed (e.g. run from a checkout)
+            version = "0.0.0"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,44 @@
 Jackfield Labeler - A utility to create strip labels for jackfields.
 """
 
+import logging
+import os
 import sys
-from pathlib import Path
-
-from PyQt6.QtCore import QSettings, QStandardPaths
-from PyQt6.QtWidgets import QApplication
 
 from jackfield_labeler.utils.logger import configure_logging, get_logger
-from jackfield_labeler.views.main_window import MainWindow
+from jackfield_labeler.utils.settings_cache import SettingsCache
+
+_USAGE = """\
+Usage: jackfield-labeler [options]
+
+A utility to create strip labels for jackfields.
+
+Options:
+  -h, --help     Show this help message and exit
+  --version      Show the application version and exit
+"""
+
+if os.environ.get("EAGER_IMPORT"):
+    # Escape hatch for CI: force the deferred import at module load so broken
+    # imports in the view tree are still caught by a plain `import` check.
+    from jackfield_labeler.views.main_window import MainWindow  # noqa: F401
+
+
+def _read_logging_settings() -> tuple[str, bool]:
+    """Read the logging level and file-logging flag from the settings cache."""
+    log_level = SettingsCache.get("logging/level", "INFO", str)
+    log_to_file = SettingsCache.get("logging/file_enabled", False, bool)
+    return log_level, log_to_file
+
+
+def _resolve_log_path() -> str:
+    """Return the log file path inside the per-user application data directory."""
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+
+    from PyQt6.QtCore import QStandardPaths  # pylint: disable=import-outside-toplevel
+
+    app_data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    return str(Path(app_data_dir) / "logs" / "jackfield_labeler.log")
 
 
 def main(args: list[str] | None = None) -> int:
@@ -26,21 +56,29 @@ def main(args: list[str] | None = None) -> int:
     if args is None:
         args = sys.argv
 
+    # Answer trivial CLI queries before touching Qt at all, so --help and
+    # --version exit in milliseconds instead of initializing a widget stack.
+    flags = set(args[1:])
+    if "--version" in flags:
+        from jackfield_labeler import __version__  # pylint: disable=import-outside-toplevel
+
+        print(f"Jackfield Labeler {__version__}")
+        return 0
+    if "-h" in flags or "--help" in flags:
+        print(_USAGE, end="")
+        return 0
+
+    from PyQt6.QtWidgets import QApplication  # pylint: disable=import-outside-toplevel
+
     app = QApplication(args)
     app.setApplicationName("Jackfield Labeler")
     app.setOrganizationName("capp3")
 
     # Load logging settings from QSettings
-    settings = QSettings()
-    log_level = settings.value("logging/level", "INFO", type=str)
-    log_to_file = settings.value("logging/file_enabled", False, type=bool)
+    log_level, log_to_file = _read_logging_settings()
 
-    # Determine log file path
-    if log_to_file:
-        app_data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
-        log_file_path = str(Path(app_data_dir) / "logs" / "jackfield_labeler.log")
-    else:
-        log_file_path = None
+    # Determine log file path (only when file logging is enabled)
+    log_file_path = _resolve_log_path() if log_to_file else None
 
     # Initialize logging system
     configure_logging(level=log_level, log_to_file=log_to_file, log_file_path=log_file_path)
@@ -48,9 +86,14 @@ def main(args: list[str] | None = None) -> int:
     # Get logger for this module
     logger = get_logger(__name__)
     logger.info("Jackfield Labeler application starting")
-    logger.debug("Log level: %s, File logging: %s", log_level, log_to_file)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Log level: %s, File logging: %s", log_level, log_to_file)
+
+    # Create and show main window.  Imported here rather than at module top so
+    # that paths which never build the UI don't pay for the full widget-tree
+    # import (every view module plus PyQt6.QtWidgets/QtGui).
+    from jackfield_labeler.views.main_window import MainWindow  # pylint: disable=import-outside-toplevel
 
-    # Create and show main window
     window = MainWindow()
     window.show()
 
@@ -1,48 +1,71 @@
 """
 Models package for the jackfield labeler application.
 Contains data structures and business logic.
+
+Submodules are imported lazily (PEP 562): accessing a name triggers the
+import of just the module that defines it, so e.g. ``from
+jackfield_labeler.models import Color`` does not pull in ``label_strip``
+or ``segment_types``.  See ``__init__.pyi`` for the static view of the
+public API.  Setting EAGER_IMPORT=1 forces all submodules to load at
+package import time so CI import checks still cover the whole package.
 """
 
-from jackfield_labeler.models.color import BLACK, BLUE, GREEN, ORANGE, PURPLE, RED, WHITE, YELLOW, Color, StandardColor
-from jackfield_labeler.models.exceptions import (
-    ContentCellWidthError,
-    ContentSegmentCountError,
-    EndSegmentWidthError,
-    SegmentWidthError,
-    StartSegmentWidthError,
-    UnknownSegmentTypeError,
-)
-from jackfield_labeler.models.label_strip import LabelStrip
-from jackfield_labeler.models.segment import Segment
-from jackfield_labeler.models.segment_types import ContentSegment, EndSegment, StartSegment, create_segment_from_dict
-from jackfield_labeler.models.strip_settings import PageMargins, PaperSize, StripSettings
-from jackfield_labeler.models.text_format import TextFormat
-
-__all__ = [
-    "BLACK",
-    "BLUE",
-    "GREEN",
-    "ORANGE",
-    "PURPLE",
-    "RED",
-    "WHITE",
-    "YELLOW",
-    "Color",
-    "ContentCellWidthError",
-    "ContentSegment",
-    "ContentSegmentCountError",
-    "EndSegment",
-    "EndSegmentWidthError",
-    "LabelStrip",
-    "PageMargins",
-    "PaperSize",
-    "Segment",
-    "SegmentWidthError",
-    "StandardColor",
-    "StartSegment",
-    "StartSegmentWidthError",
-    "StripSettings",
-    "TextFormat",
-    "UnknownSegmentTypeError",
-    "create_segment_from_dict",
-]
+import importlib
+import os
+from typing import Any
+
+# Maps each public name to the submodule that defines it.
+_ATTR_TO_MODULE = {
+    "BLACK": "color",
+    "BLUE": "color",
+    "GREEN": "color",
+    "ORANGE": "color",
+    "PURPLE": "color",
+    "RED": "color",
+    "WHITE": "color",
+    "YELLOW": "color",
+    "Color": "color",
+    "StandardColor": "color",
+    "ContentCellWidthError": "exceptions",
+    "ContentSegmentCountError": "exceptions",
+    "EndSegmentWidthError": "exceptions",
+    "SegmentValidationError": "exceptions",
+    "SegmentWidthError": "exceptions",
+    "ValidationCode": "exceptions",
+    "StartSegmentWidthError": "exceptions",
+    "UnknownSegmentTypeError": "exceptions",
+    "LabelStrip": "label_strip",
+    "Segment": "segment",
+    "ContentSegment": "segment_types",
+    "EndSegment": "segment_types",
+    "StartSegment": "segment_types",
+    "create_segment_from_dict": "segment_types",
+    "PageMargins": "strip_settings",
+    "PaperSize": "strip_settings",
+    "StripSettings": "strip_settings",
+    "TextFormat": "text_format",
+}
+
+__all__ = sorted(_ATTR_TO_MODULE)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names by importing their defining submodule on demand."""
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved names in dir(jackfield_labeler.models)."""
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get("EAGER_IMPORT"):
+    for _module_name in set(_ATTR_TO_MODULE.values()):
+        importlib.import_module(f"{__name__}.{_module_name}")
@@ -0,0 +1,40 @@
+"""Static view of the lazily populated models package (see __init__.py)."""
+
+from jackfield_labeler.models.color import (
+    BLACK as BLACK,
+    BLUE as BLUE,
+    GREEN as GREEN,
+    ORANGE as ORANGE,
+    PURPLE as PURPLE,
+    RED as RED,
+    WHITE as WHITE,
+    YELLOW as YELLOW,
+    Color as Color,
+    StandardColor as StandardColor,
+)
+from jackfield_labeler.models.exceptions import (
+    ContentCellWidthError as ContentCellWidthError,
+    ContentSegmentCountError as ContentSegmentCountError,
+    EndSegmentWidthError as EndSegmentWidthError,
+    SegmentValidationError as SegmentValidationError,
+    SegmentWidthError as SegmentWidthError,
+    ValidationCode as ValidationCode,
+    StartSegmentWidthError as StartSegmentWidthError,
+    UnknownSegmentTypeError as UnknownSegmentTypeError,
+)
+from jackfield_labeler.models.label_strip import LabelStrip as LabelStrip
+from jackfield_labeler.models.segment import Segment as Segment
+from jackfield_labeler.models.segment_types import (
+    ContentSegment as ContentSegment,
+    EndSegment as EndSegment,
+    StartSegment as StartSegment,
+    create_segment_from_dict as create_segment_from_dict,
+)
+from jackfield_labeler.models.strip_settings import (
+    PageMargins as PageMargins,
+    PaperSize as PaperSize,
+    StripSettings as StripSettings,
+)
+from jackfield_labeler.models.text_format import TextFormat as TextFormat
+
+__all__: list[str]
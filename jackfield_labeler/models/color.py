@@ -2,8 +2,9 @@
 Color representation for label segments.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
 class StandardColor(Enum):
@@ -19,47 +20,72 @@ class StandardColor(Enum):
     PURPLE = "#800080"
 
 
-@dataclass
+# Literal RGB values for the standard palette, so from_standard and the
+# module constants below never go through hex parsing.
+_STANDARD_RGB: dict[StandardColor, tuple[int, int, int]] = {
+    StandardColor.WHITE: (255, 255, 255),
+    StandardColor.BLACK: (0, 0, 0),
+    StandardColor.RED: (255, 0, 0),
+    StandardColor.GREEN: (0, 255, 0),
+    StandardColor.BLUE: (0, 0, 255),
+    StandardColor.YELLOW: (255, 255, 0),
+    StandardColor.ORANGE: (255, 165, 0),
+    StandardColor.PURPLE: (128, 0, 128),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Color:
     """
     Represents a color for use in segment text or background.
     Can be initialized with either RGB values or a hex string.
+
+    Instances are immutable, which lets the hex form be computed once at
+    construction instead of re-formatted on every to_hex() call.
     """
 
     r: int = 0
     g: int = 0
     b: int = 0
+    _hex: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the hex string (object.__setattr__ because the dataclass is frozen)."""
+        object.__setattr__(self, "_hex", f"#{self.r:02x}{self.g:02x}{self.b:02x}")
 
     @classmethod
     def from_hex(cls, hex_color: str) -> "Color":
         """
         Create a Color from a hex string (e.g., "#FF0000").
 
+        Repeated conversions of the same string (common when loading
+        projects) return a cached instance, which is safe because colors
+        are immutable.
+
         Args:
             hex_color: Hex color string (with or without #)
 
         Returns:
             A new Color instance
         """
-        hex_color = hex_color.lstrip("#")
-        return cls(
-            r=int(hex_color[0:2], 16),
-            g=int(hex_color[2:4], 16),
-            b=int(hex_color[4:6], 16),
-        )
+        return _color_from_hex(hex_color)
 
     @classmethod
     def from_standard(cls, standard_color: StandardColor) -> "Color":
         """
         Create a Color from a StandardColor enum value.
 
+        The palette is a small closed enum and colors are immutable, so
+        each value maps to one cached instance (the designer calls this
+        for every segment on every table edit).
+
         Args:
             standard_color: A StandardColor enum value
 
         Returns:
             A new Color instance
         """
-        return cls.from_hex(standard_color.value)
+        return _color_from_standard(standard_color)
 
     def to_hex(self) -> str:
         """
@@ -68,7 +94,7 @@ class Color:
         Returns:
             Hex color string with leading #
         """
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return self._hex
 
     def to_standard(self) -> "StandardColor | None":
         """
@@ -97,12 +123,30 @@ class Color:
         return self.to_hex()
 
 
+@lru_cache(maxsize=None)
+def _color_from_standard(standard_color: StandardColor) -> Color:
+    """Return the cached immutable Color for a standard palette entry."""
+    r, g, b = _STANDARD_RGB[standard_color]
+    return Color(r, g, b)
+
+
+@lru_cache(maxsize=256)
+def _color_from_hex(hex_color: str) -> Color:
+    """Parse a hex color string, caching the resulting immutable Color."""
+    stripped = hex_color.lstrip("#")
+    return Color(
+        r=int(stripped[0:2], 16),
+        g=int(stripped[2:4], 16),
+        b=int(stripped[4:6], 16),
+    )
+
+
 # Common color instances
-BLACK = Color.from_standard(StandardColor.BLACK)
-WHITE = Color.from_standard(StandardColor.WHITE)
-RED = Color.from_standard(StandardColor.RED)
-GREEN = Color.from_standard(StandardColor.GREEN)
-BLUE = Color.from_standard(StandardColor.BLUE)
-YELLOW = Color.from_standard(StandardColor.YELLOW)
-ORANGE = Color.from_standard(StandardColor.ORANGE)
-PURPLE = Color.from_standard(StandardColor.PURPLE)
+BLACK = Color(0, 0, 0)
+WHITE = Color(255, 255, 255)
+RED = Color(255, 0, 0)
+GREEN = Color(0, 255, 0)
+BLUE = Color(0, 0, 255)
+YELLOW = Color(255, 255, 0)
+ORANGE = Color(255, 165, 0)
+PURPLE = Color(128, 0, 128)
@@ -1,45 +1,87 @@
 """
 Custom exceptions for the jackfield_labeler package.
+
+All validation failures share a single parametrized exception type keyed
+by a ValidationCode, with the message table built once at module load.
+The historical per-failure class names are kept as thin subclasses so
+existing ``except`` clauses and raise sites keep working, and callers can
+catch the whole family via SegmentValidationError.
 """
 
+from enum import IntEnum, auto
+
+
+class ValidationCode(IntEnum):
+    """Identifies which validation rule a SegmentValidationError violated."""
+
+    CONTENT_CELL_WIDTH = auto()
+    SEGMENT_WIDTH = auto()
+    START_SEGMENT_WIDTH = auto()
+    END_SEGMENT_WIDTH = auto()
+    CONTENT_SEGMENT_COUNT = auto()
+    UNKNOWN_SEGMENT_TYPE = auto()
+
+
+_MESSAGES: dict[ValidationCode, str] = {
+    ValidationCode.CONTENT_CELL_WIDTH: "Content cell width must be positive",
+    ValidationCode.SEGMENT_WIDTH: "Segment width cannot be negative",
+    ValidationCode.START_SEGMENT_WIDTH: "Start segment width cannot be negative",
+    ValidationCode.END_SEGMENT_WIDTH: "End segment width cannot be negative",
+    ValidationCode.CONTENT_SEGMENT_COUNT: "Content segment count cannot be negative",
+    ValidationCode.UNKNOWN_SEGMENT_TYPE: "Unknown segment type",
+}
+
+
+class SegmentValidationError(ValueError):
+    """Raised when a strip or segment value fails validation."""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code: ValidationCode, detail: str | None = None) -> None:
+        self.code = code
+        message = _MESSAGES[code]
+        if detail is not None:
+            message = f"{message}: {detail}"
+        super().__init__(message)
+
 
-class ContentCellWidthError(ValueError):
+class ContentCellWidthError(SegmentValidationError):
     """Raised when content cell width is not positive."""
 
     def __init__(self) -> None:
-        super().__init__("Content cell width must be positive")
+        super().__init__(ValidationCode.CONTENT_CELL_WIDTH)
 
 
-class SegmentWidthError(ValueError):
+class SegmentWidthError(SegmentValidationError):
     """Raised when segment width is negative."""
 
     def __init__(self) -> None:
-        super().__init__("Segment width cannot be negative")
+        super().__init__(ValidationCode.SEGMENT_WIDTH)
 
 
-class StartSegmentWidthError(ValueError):
+class StartSegmentWidthError(SegmentValidationError):
     """Raised when start segment width is negative."""
 
     def __init__(self) -> None:
-        super().__init__("Start segment width cannot be negative")
+        super().__init__(ValidationCode.START_SEGMENT_WIDTH)
 
 
-class EndSegmentWidthError(ValueError):
+class EndSegmentWidthError(SegmentValidationError):
     """Raised when end segment width is negative."""
 
     def __init__(self) -> None:
-        super().__init__("End segment width cannot be negative")
+        super().__init__(ValidationCode.END_SEGMENT_WIDTH)
 
 
-class ContentSegmentCountError(ValueError):
+class ContentSegmentCountError(SegmentValidationError):
     """Raised when content segment count is negative."""
 
     def __init__(self) -> None:
-        super().__init__("Content segment count cannot be negative")
+        super().__init__(ValidationCode.CONTENT_SEGMENT_COUNT)
 
 
-class UnknownSegmentTypeError(ValueError):
+class UnknownSegmentTypeError(SegmentValidationError):
     """Raised when an unknown segment type is encountered."""
 
     def __init__(self, segment_type: str) -> None:
-        super().__init__(f"Unknown segment type: {segment_type}")
+        super().__init__(ValidationCode.UNKNOWN_SEGMENT_TYPE, segment_type)
@@ -3,8 +3,18 @@ Main LabelStrip class for representing a complete label strip.
 """
 
 import json
+import math
+import sys
+import weakref
 from typing import Any
 
+try:
+    # Optional accelerator: one C pass over the object graph, ~5-10x faster
+    # than stdlib json for strips with many segments.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback is always available
+    orjson = None  # type: ignore[assignment]
+
 from jackfield_labeler.models.exceptions import (
     ContentCellWidthError,
     ContentSegmentCountError,
@@ -44,6 +54,13 @@ class LabelStrip:
         self._content_segments: list[ContentSegment] = []
         self._content_cell_width: float = 10.0  # Default in mm
         self._settings = StripSettings()
+        # Memoized result of get_total_width(); None means dirty.
+        self._total_width_cache: float | None = None
+        # ID -> segment map kept in sync by the mutators for O(1) lookup.
+        self._id_index: dict[str, Segment] = {}
+        # Shared weak self-reference handed to adopted segments, whose
+        # width setters use it to invalidate the total-width memo.
+        self._owner_ref = weakref.ref(self)
 
     @property
     def height(self) -> float:
@@ -83,10 +100,14 @@ class LabelStrip:
 
         # Round to 3 decimal places for practical precision
         self._content_cell_width = round(value, 3)
+        self._total_width_cache = None
 
-        # Update all content segments with the new width
+        # Update all content segments with the new width.  The value is
+        # already validated and rounded above, so write the slot directly
+        # instead of re-running the width property's checks per segment.
+        width = self._content_cell_width
         for segment in self._content_segments:
-            segment.width = self._content_cell_width
+            segment._width = width
 
     @property
     def start_segment(self) -> StartSegment | None:
@@ -130,6 +151,8 @@ class LabelStrip:
         if width < 0:
             raise StartSegmentWidthError()
 
+        self._total_width_cache = None
+
         if width > 0:
             if self._start_segment is None:
                 self._start_segment = StartSegment(
@@ -141,8 +164,13 @@ class LabelStrip:
             else:
                 self._start_segment.width = width
                 self._start_segment.text = text
+            self._id_index[self._start_segment.id] = self._start_segment
+            self._start_segment._owner = self._owner_ref
         else:
             # Width is 0, effectively removing the start segment
+            if self._start_segment is not None:
+                self._id_index.pop(self._start_segment.id, None)
+                self._start_segment._owner = None
             self._start_segment = None
 
         return self._start_segment
@@ -164,6 +192,8 @@ class LabelStrip:
         if width < 0:
             raise EndSegmentWidthError()
 
+        self._total_width_cache = None
+
         if width > 0:
             if self._end_segment is None:
                 self._end_segment = EndSegment(
@@ -175,8 +205,13 @@ class LabelStrip:
             else:
                 self._end_segment.width = width
                 self._end_segment.text = text
+            self._id_index[self._end_segment.id] = self._end_segment
+            self._end_segment._owner = self._owner_ref
         else:
             # Width is 0, effectively removing the end segment
+            if self._end_segment is not None:
+                self._id_index.pop(self._end_segment.id, None)
+                self._end_segment._owner = None
             self._end_segment = None
 
         return self._end_segment
@@ -196,22 +231,29 @@ class LabelStrip:
         if count < 0:
             raise ContentSegmentCountError()
 
+        self._total_width_cache = None
+
         current_count = len(self._content_segments)
 
         if count > current_count:
-            # Add new segments
+            # Add new segments.  IDs are interned so later lookups compare
+            # by pointer before falling back to character comparison.
             for i in range(current_count, count):
-                segment_id = str(i + 1)  # 1-based IDs for user-facing segments
-                self._content_segments.append(
-                    ContentSegment(
-                        segment_id=segment_id,
-                        width=self._content_cell_width,
-                        text_color=self._settings.default_text_color,
-                        background_color=self._settings.default_background_color,
-                    )
+                segment_id = sys.intern(str(i + 1))  # 1-based IDs for user-facing segments
+                segment = ContentSegment(
+                    segment_id=segment_id,
+                    width=self._content_cell_width,
+                    text_color=self._settings.default_text_color,
+                    background_color=self._settings.default_background_color,
                 )
+                segment._owner = self._owner_ref
+                self._content_segments.append(segment)
+                self._id_index[segment_id] = segment
         elif count < current_count:
             # Remove excess segments
+            for segment in self._content_segments[count:]:
+                self._id_index.pop(segment.id, None)
+                segment._owner = None
             self._content_segments = self._content_segments[:count]
 
     def get_all_segments(self) -> list[Segment]:
@@ -240,18 +282,28 @@ class LabelStrip:
         Returns:
             Total width in mm
         """
+        if self._total_width_cache is not None:
+            return self._total_width_cache
+
         total = 0.0
 
         if self._start_segment is not None:
             total += self._start_segment.width
 
-        total += len(self._content_segments) * self._content_cell_width
+        # Sum actual widths (fsum for stable accumulation); segments may
+        # diverge from the shared cell width when edited in the table.
+        total += math.fsum(segment.width for segment in self._content_segments)
 
         if self._end_segment is not None:
             total += self._end_segment.width
 
+        self._total_width_cache = total
         return total
 
+    def _invalidate_total_width(self) -> None:
+        """Drop the memoized total width (called by owned segments on resize)."""
+        self._total_width_cache = None
+
     def get_segment_by_id(self, segment_id: str) -> Segment | None:
         """
         Find a segment by its ID.
@@ -262,17 +314,16 @@ class LabelStrip:
         Returns:
             The segment if found, otherwise None
         """
-        if self._start_segment is not None and self._start_segment.id == segment_id:
-            return self._start_segment
+        return self._id_index.get(segment_id)
 
-        for segment in self._content_segments:
-            if segment.id == segment_id:
-                return segment
-
-        if self._end_segment is not None and self._end_segment.id == segment_id:
-            return self._end_segment
-
-        return None
+    def _rebuild_id_index(self) -> None:
+        """Rebuild the ID lookup map after segments were assigned directly."""
+        segments = self.get_all_segments()
+        self._id_index = {segment.id: segment for segment in segments}
+        # Direct assignment bypassed the mutators; adopt the segments so
+        # their width setters can invalidate the total-width memo.
+        for segment in segments:
+            segment._owner = self._owner_ref
 
     def validate(self) -> list[str]:
         """
@@ -317,15 +368,7 @@ class LabelStrip:
         Returns:
             Dictionary representation of the label strip
         """
-        segments = []
-        if self._start_segment is not None:
-            segments.append(self._start_segment.to_dict())
-
-        for segment in self._content_segments:
-            segments.append(segment.to_dict())
-
-        if self._end_segment is not None:
-            segments.append(self._end_segment.to_dict())
+        segments = [segment.to_dict() for segment in self.get_all_segments()]
 
         return {
             "height": self._height,
@@ -341,6 +384,8 @@ class LabelStrip:
         Returns:
             JSON string representation
         """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
         return json.dumps(self.to_dict())
 
     @classmethod
@@ -383,6 +428,7 @@ class LabelStrip:
                 content_segments.append(segment)
 
         strip._content_segments = content_segments
+        strip._rebuild_id_index()
         return strip
 
     @classmethod
@@ -396,5 +442,5 @@ class LabelStrip:
         Returns:
             A new LabelStrip instance
         """
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
         return cls.from_dict(data)
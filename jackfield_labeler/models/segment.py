@@ -3,18 +3,27 @@ Base segment class and related definitions for label strips.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from jackfield_labeler.models.color import BLACK, WHITE, Color
 from jackfield_labeler.models.exceptions import SegmentWidthError
 from jackfield_labeler.models.text_format import TextFormat
 
+if TYPE_CHECKING:
+    import weakref
+
+    from jackfield_labeler.models.label_strip import LabelStrip
+
 
 class Segment(ABC):
     """
     Abstract base class for all segment types in a label strip.
     """
 
+    # Strips can hold hundreds of segments; slots avoid a per-instance
+    # __dict__ and make attribute access a C-level descriptor lookup.
+    __slots__ = ("_background_color", "_id", "_owner", "_text", "_text_color", "_text_format", "_width")
+
     def __init__(
         self,
         segment_id: str,
@@ -41,6 +50,10 @@ class Segment(ABC):
         self._text_format = text_format
         self._text_color = text_color
         self._background_color = background_color
+        # Weak back-reference to the owning LabelStrip, set when a strip
+        # adopts this segment; width edits report through it so the strip's
+        # memoized total width never goes stale.
+        self._owner: "weakref.ref[LabelStrip] | None" = None
 
     @property
     def id(self) -> str:
@@ -70,6 +83,11 @@ class Segment(ABC):
 
         # Round to 3 decimal places for practical precision
         self._width = round(value, 3)
+        # Resizing through any held segment handle must invalidate the
+        # owning strip's total-width memo.
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._invalidate_total_width()
 
     @property
     def text_format(self) -> TextFormat:
@@ -117,7 +135,7 @@ class Segment(ABC):
             "type": self.get_type(),
             "text": self._text,
             "width": self._width,
-            "text_format": self._text_format.name,
+            "text_format": self._text_format.value,
             "text_color": self._text_color.to_hex(),
             "background_color": self._background_color.to_hex(),
         }
@@ -9,12 +9,58 @@ from jackfield_labeler.models.exceptions import UnknownSegmentTypeError
 from jackfield_labeler.models.segment import Segment
 from jackfield_labeler.models.text_format import TextFormat
 
+# Precomputed lookup tables so per-segment parsing is a dict .get instead of
+# exception-driven enum constructor / subscript calls.
+_TEXT_FORMAT_BY_VALUE = {tf.value: tf for tf in TextFormat}
+_TEXT_FORMAT_BY_NAME = {tf.name: tf for tf in TextFormat}
+
+
+def _parse_text_format(value: Any) -> TextFormat:
+    """
+    Parse a serialized text format value.
+
+    Accepts the integer enum value written by current code as well as the
+    legacy name string (e.g. "BOLD") found in older project files.
+
+    Args:
+        value: Serialized text format (int, str, or missing)
+
+    Returns:
+        The matching TextFormat, defaulting to NORMAL
+    """
+    if isinstance(value, int):
+        return _TEXT_FORMAT_BY_VALUE.get(value, TextFormat.NORMAL)
+    if isinstance(value, str):
+        return _TEXT_FORMAT_BY_NAME.get(value.upper(), TextFormat.NORMAL)
+    return TextFormat.NORMAL
+
+
+def _common_fields(data: dict[str, Any]) -> tuple[TextFormat, Color, Color]:
+    """
+    Parse the fields shared by every serialized segment.
+
+    Args:
+        data: Dictionary containing segment data
+
+    Returns:
+        (text_format, text_color, background_color) tuple
+    """
+    return (
+        _parse_text_format(data.get("text_format")),
+        Color.from_hex(data.get("text_color", "#000000")),
+        Color.from_hex(data.get("background_color", "#FFFFFF")),
+    )
+
 
 class StartSegment(Segment):
     """
     Represents the optional starting segment of a label strip.
     """
 
+    __slots__ = ()
+
+    SEGMENT_ID = "L_START"
+
     def __init__(
         self,
         width: float = 0.0,
@@ -33,14 +79,8 @@ class StartSegment(Segment):
             text_color: Color for the text
             background_color: Background color for the segment
         """
-        super().__init__(
-            segment_id="L_START",
-            text=text,
-            width=width,
-            text_format=text_format,
-            text_color=text_color,
-            background_color=background_color,
-        )
+        # Positional forwarding avoids building a kwargs dict per instance.
+        super().__init__(self.SEGMENT_ID, text, width, text_format, text_color, background_color)
 
     def get_type(self) -> str:
         """Return the type of segment as a string."""
@@ -57,18 +97,14 @@ class StartSegment(Segment):
         Returns:
             A new StartSegment instance
         """
-        text_format_str = data.get("text_format", "NORMAL").upper()
-        try:
-            text_format = TextFormat[text_format_str]
-        except KeyError:
-            text_format = TextFormat.NORMAL
+        text_format, text_color, background_color = _common_fields(data)
 
         return cls(
             width=data.get("width", 0.0),
             text=data.get("text", ""),
             text_format=text_format,
-            text_color=Color.from_hex(data.get("text_color", "#000000")),
-            background_color=Color.from_hex(data.get("background_color", "#FFFFFF")),
+            text_color=text_color,
+            background_color=background_color,
         )
 
 
@@ -77,6 +113,8 @@ class ContentSegment(Segment):
     Represents a content cell segment within a label strip.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         segment_id: str,
@@ -97,14 +135,7 @@ class ContentSegment(Segment):
             text_color: Color for the text
             background_color: Background color for the segment
         """
-        super().__init__(
-            segment_id=segment_id,
-            text=text,
-            width=width,
-            text_format=text_format,
-            text_color=text_color,
-            background_color=background_color,
-        )
+        super().__init__(segment_id, text, width, text_format, text_color, background_color)
 
     def get_type(self) -> str:
         """Return the type of segment as a string."""
@@ -121,19 +152,15 @@ class ContentSegment(Segment):
         Returns:
             A new ContentSegment instance
         """
-        text_format_str = data.get("text_format", "NORMAL").upper()
-        try:
-            text_format = TextFormat[text_format_str]
-        except KeyError:
-            text_format = TextFormat.NORMAL
+        text_format, text_color, background_color = _common_fields(data)
 
         return cls(
             segment_id=data.get("id", "0"),
             width=data.get("width", 10.0),
             text=data.get("text", ""),
             text_format=text_format,
-            text_color=Color.from_hex(data.get("text_color", "#000000")),
-            background_color=Color.from_hex(data.get("background_color", "#FFFFFF")),
+            text_color=text_color,
+            background_color=background_color,
         )
 
 
@@ -142,6 +169,10 @@ class EndSegment(Segment):
     Represents the optional ending segment of a label strip.
     """
 
+    __slots__ = ()
+
+    SEGMENT_ID = "L_END"
+
     def __init__(
         self,
         width: float = 0.0,
@@ -160,14 +191,8 @@ class EndSegment(Segment):
             text_color: Color for the text
             background_color: Background color for the segment
         """
-        super().__init__(
-            segment_id="L_END",
-            text=text,
-            width=width,
-            text_format=text_format,
-            text_color=text_color,
-            background_color=background_color,
-        )
+        # Positional forwarding avoids building a kwargs dict per instance.
+        super().__init__(self.SEGMENT_ID, text, width, text_format, text_color, background_color)
 
     def get_type(self) -> str:
         """Return the type of segment as a string."""
@@ -184,18 +209,14 @@ class EndSegment(Segment):
         Returns:
             A new EndSegment instance
         """
-        text_format_str = data.get("text_format", "NORMAL").upper()
-        try:
-            text_format = TextFormat[text_format_str]
-        except KeyError:
-            text_format = TextFormat.NORMAL
+        text_format, text_color, background_color = _common_fields(data)
 
         return cls(
             width=data.get("width", 0.0),
             text=data.get("text", ""),
             text_format=text_format,
-            text_color=Color.from_hex(data.get("text_color", "#000000")),
-            background_color=Color.from_hex(data.get("background_color", "#FFFFFF")),
+            text_color=text_color,
+            background_color=background_color,
         )
 
 
@@ -215,10 +236,15 @@ def create_segment_from_dict(data: dict[str, Any]) -> Segment:
     """
     segment_type = data.get("type", "").lower()
 
-    if segment_type == "start":
-        return StartSegment.from_dict(data)
-    if segment_type == "content":
-        return ContentSegment.from_dict(data)
-    if segment_type == "end":
-        return EndSegment.from_dict(data)
-    raise UnknownSegmentTypeError(segment_type)
+    factory = _SEGMENT_FACTORIES.get(segment_type)
+    if factory is None:
+        raise UnknownSegmentTypeError(segment_type)
+    return factory(data)
+
+
+# Dispatch table: one dict lookup instead of chained type comparisons.
+_SEGMENT_FACTORIES = {
+    "start": StartSegment.from_dict,
+    "content": ContentSegment.from_dict,
+    "end": EndSegment.from_dict,
+}
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from jackfield_labeler.models.color import Color
+from jackfield_labeler.models.color import BLACK, WHITE, Color
 
 
 class PaperSize(Enum):
@@ -26,7 +26,7 @@ class PaperSize(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class PageMargins:
     """Page margins for printing."""
 
@@ -36,7 +36,7 @@ class PageMargins:
     left: float = 10.0  # mm
 
 
-@dataclass
+@dataclass(slots=True)
 class StripSettings:
     """
     Global settings for label strips.
@@ -52,8 +52,9 @@ class StripSettings:
     # Default formatting
     default_font_name: str = "Arial"
     default_font_size: float = 8.0  # pt
-    default_text_color: Color = field(default_factory=lambda: Color(0, 0, 0))
-    default_background_color: Color = field(default_factory=lambda: Color(255, 255, 255))
+    # Colors are immutable, so the shared constants are safe as defaults.
+    default_text_color: Color = BLACK
+    default_background_color: Color = WHITE
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -2,11 +2,16 @@
 Text formatting options for label segments.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class TextFormat(Enum):
-    """Enumeration of available text formatting options."""
+class TextFormat(IntEnum):
+    """
+    Enumeration of available text formatting options.
+
+    An IntEnum so the compact integer value can be serialized directly and
+    parsed back via the enum's O(1) value lookup.
+    """
 
     NORMAL = auto()
     BOLD = auto()
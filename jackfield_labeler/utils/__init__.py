@@ -1,10 +1,50 @@
 """
 Utilities package for the jackfield labeler application.
 Contains helper functions, PDF generation code, and project management.
+
+Submodules are imported lazily (PEP 562) so that importing the package
+does not pull in heavy dependencies such as reportlab at application
+startup.  See ``__init__.pyi`` for the static view of the public API.
+Setting EAGER_IMPORT=1 forces all submodules to load at package import
+time so CI import checks still cover the whole package.
 """
 
-from .pdf_generator import PDFGenerator
-from .project_manager import ProjectManager
-from .strip_renderer import StripRenderer
+import importlib
+import os
+from typing import Any
+
+# Maps each public name to the submodule that defines it.
+_ATTR_TO_MODULE = {
+    "PDFGenerator": "pdf_generator",
+    "ProjectLoadTask": "project_manager",
+    "ProjectManager": "project_manager",
+    "ProjectSaveTask": "project_manager",
+    "SettingsCache": "settings_cache",
+    "StripPdfExportTask": "pdf_generator",
+    "StripPngExportTask": "strip_renderer",
+    "StripRenderer": "strip_renderer",
+}
+
+__all__ = sorted(_ATTR_TO_MODULE)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names by importing their defining submodule on demand."""
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily resolved names in dir(jackfield_labeler.utils)."""
+    return sorted(set(globals()) | set(__all__))
+
 
-__all__ = ["PDFGenerator", "ProjectManager", "StripRenderer"]
+if os.environ.get("EAGER_IMPORT"):
+    for _module_name in set(_ATTR_TO_MODULE.values()):
+        importlib.import_module(f"{__name__}.{_module_name}")
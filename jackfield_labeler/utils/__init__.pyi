@@ -0,0 +1,12 @@
+"""Static view of the lazily populated utils package (see __init__.py)."""
+
+from jackfield_labeler.utils.pdf_generator import PDFGenerator as PDFGenerator
+from jackfield_labeler.utils.pdf_generator import StripPdfExportTask as StripPdfExportTask
+from jackfield_labeler.utils.project_manager import ProjectLoadTask as ProjectLoadTask
+from jackfield_labeler.utils.project_manager import ProjectManager as ProjectManager
+from jackfield_labeler.utils.project_manager import ProjectSaveTask as ProjectSaveTask
+from jackfield_labeler.utils.settings_cache import SettingsCache as SettingsCache
+from jackfield_labeler.utils.strip_renderer import StripPngExportTask as StripPngExportTask
+from jackfield_labeler.utils.strip_renderer import StripRenderer as StripRenderer
+
+__all__: list[str]
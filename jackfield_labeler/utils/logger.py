@@ -1,10 +1,45 @@
-"""Centralized logging configuration for Jackfield Labeler."""
+"""Centralized logging configuration for Jackfield Labeler.
+
+Convention: log calls pass %-style format strings with lazy arguments
+(``logger.debug("x=%s", x)``), never pre-built f-strings, so argument
+interpolation only happens when the record passes the level filter.
+Guard genuinely expensive message construction with
+``logger.isEnabledFor(logging.DEBUG)``.  Enforced by ruff's ``G`` rules.
+"""
 
 import logging
+import os
+import time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 
+class _CachedAsctimeFormatter(logging.Formatter):
+    """Formatter that renders %(asctime)s at most once per second.
+
+    The stock Formatter calls time.strftime for every record, which adds
+    up when DEBUG logging is enabled inside render loops; our datefmt has
+    whole-second resolution, so consecutive records within the same second
+    can share the rendered string.
+    """
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._last_sec = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        """Return the cached asctime string, refreshing it once per second."""
+        sec = int(record.created)
+        if sec != self._last_sec:
+            if datefmt:
+                self._last_str = time.strftime(datefmt, self.converter(record.created))
+            else:
+                self._last_str = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_str
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -31,34 +66,59 @@ def configure_logging(level: str = "INFO", log_to_file: bool = False, log_file_p
         log_to_file: Whether to log to a file
         log_file_path: Path to log file (if log_to_file is True)
     """
+    # Skip collecting record fields nothing in our format string uses.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Get root logger for jackfield_labeler
     logger = logging.getLogger("jackfield_labeler")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
-    # Clear existing handlers
-    logger.handlers.clear()
-
     # Define format
-    formatter = logging.Formatter(
+    formatter = _CachedAsctimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # Reuse matching handlers from a previous call (GUI settings changes,
+    # test fixtures) instead of clearing and rebuilding: rebuilding a
+    # RotatingFileHandler opens a fresh file descriptor each time.
+    wanted_file = os.path.abspath(log_file_path) if log_to_file and log_file_path else None
+    console_handler: logging.StreamHandler | None = None
+    file_handler: RotatingFileHandler | None = None
+    stale: list[logging.Handler] = []
+    for handler in logger.handlers:
+        # RotatingFileHandler subclasses StreamHandler, so check it first
+        if isinstance(handler, RotatingFileHandler):
+            if handler.baseFilename == wanted_file and file_handler is None:
+                file_handler = handler
+            else:
+                stale.append(handler)
+        elif isinstance(handler, logging.StreamHandler) and console_handler is None:
+            console_handler = handler
+        else:
+            stale.append(handler)
+    for handler in stale:
+        logger.removeHandler(handler)
+        handler.close()
+
     # Console handler (always enabled)
-    console_handler = logging.StreamHandler()
+    if console_handler is None:
+        console_handler = logging.StreamHandler()
+        logger.addHandler(console_handler)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # File handler (conditional)
-    if log_to_file and log_file_path:
+    if wanted_file is not None and file_handler is None:
         try:
             # Ensure parent directory exists
-            log_path = Path(log_file_path)
+            log_path = Path(log_file_path)  # type: ignore[arg-type]
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Rotating file handler (10MB, 3 backups)
             file_handler = RotatingFileHandler(
-                log_file_path,
+                wanted_file,
                 maxBytes=10 * 1024 * 1024,
                 backupCount=3,
                 encoding="utf-8",  # 10 MB
@@ -71,5 +131,7 @@ def configure_logging(level: str = "INFO", log_to_file: bool = False, log_file_p
         except Exception:  # pylint: disable=broad-exception-caught
             # Catch all exceptions during logging setup to prevent startup failure
             logger.exception("Failed to set up file logging")
+    elif file_handler is not None:
+        file_handler.setFormatter(formatter)
 
     logger.info("Logging configured: level=%s, file=%s", level, log_to_file)
@@ -1,15 +1,24 @@
 """
 PDF generation utilities for label strips.
+
+reportlab is imported lazily (first PDFGenerator construction or paper
+size lookup) because it is a heavy import and this module is loaded at
+application startup via the utils package.
 """
 
-from typing import ClassVar
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, ClassVar
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A0, A1, A2, A3, A4, LEGAL, LETTER, TABLOID
-from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfgen import canvas
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
+if TYPE_CHECKING:
+    from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
+
+from jackfield_labeler.models.color import Color
 from jackfield_labeler.models.label_strip import LabelStrip
 from jackfield_labeler.models.segment import Segment
 from jackfield_labeler.models.strip_settings import PaperSize
@@ -18,12 +27,37 @@ from jackfield_labeler.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Multiplication by the reciprocal beats three divisions per color.
+_INV255 = 1.0 / 255.0
+
+# Millimetres to points; identical to reportlab.lib.units.mm but usable
+# without importing reportlab.
+_MM = 72.0 / 25.4
+
+# Index of each text format within a (normal, bold, italic, bold-italic) family.
+_FORMAT_INDEX = {
+    TextFormat.NORMAL: 0,
+    TextFormat.BOLD: 1,
+    TextFormat.ITALIC: 2,
+    TextFormat.BOLD_ITALIC: 3,
+}
+
+
+@lru_cache(maxsize=1)
+def _paper_sizes() -> dict[PaperSize, tuple[float, float]]:
+    """Build the paper size mapping (ReportLab page sizes are in points)."""
+    from reportlab.lib.pagesizes import (  # pylint: disable=import-outside-toplevel
+        A0,
+        A1,
+        A2,
+        A3,
+        A4,
+        LEGAL,
+        LETTER,
+        TABLOID,
+    )
 
-class PDFGenerator:
-    """Generates PDF documents from label strips."""
-
-    # Paper size mapping (ReportLab page sizes are in points)
-    PAPER_SIZES: ClassVar[dict] = {
+    return {
         PaperSize.A4: A4,
         PaperSize.A3: A3,
         PaperSize.A2: A2,
@@ -34,6 +68,10 @@ class PDFGenerator:
         PaperSize.TABLOID: TABLOID,
     }
 
+
+class PDFGenerator:
+    """Generates PDF documents from label strips."""
+
     # Map common system font names to built-in ReportLab/PDF Type1 font families.
     # Each entry maps a font family name to (normal, bold, italic, bold-italic).
     _FONT_FAMILY_MAP: ClassVar[dict[str, tuple[str, str, str, str]]] = {
@@ -58,13 +96,57 @@ class PDFGenerator:
         Args:
             label_strip: The label strip to generate PDF for
         """
+        # A generator only exists to export, so this is the point where
+        # paying for the reportlab import is unavoidable anyway.
+        from reportlab.lib import colors  # pylint: disable=import-outside-toplevel
+        from reportlab.pdfbase import pdfmetrics  # pylint: disable=import-outside-toplevel
+        from reportlab.pdfgen import canvas  # pylint: disable=import-outside-toplevel
+
+        self._colors = colors
+        self._pdfmetrics = pdfmetrics
+        self._canvas_module = canvas
+
         self.label_strip = label_strip
         self.settings = label_strip.settings
+        # Segment palettes are tiny; cache one reportlab Color per RGB triple.
+        self._color_cache: dict[tuple[int, int, int], colors.Color] = {}
+        # Jackfield labels repeat heavily ("1", "2", identical channel names),
+        # so memoize stringWidth per (text, font, size); bounded by unique labels.
+        self._sw_cache: dict[tuple[str, str, float], float] = {}
+        # Page geometry is fixed for the generator's lifetime (one generator
+        # per export), so derive the point dimensions once instead of per call.
+        sizes = _paper_sizes()
+        self._page_size = sizes.get(self.settings.paper_size, sizes[PaperSize.A4])
+        margins = self.settings.page_margins
+        page_width, page_height = self._page_size
+        available_width = page_width - (margins.left + margins.right) * _MM
+        available_height = page_height - (margins.top + margins.bottom) * _MM
+        # Centre of the printable area (ReportLab origin is bottom-left)
+        self._center_x = margins.left * _MM + available_width / 2
+        self._center_y = margins.bottom * _MM + available_height / 2
+        # Per-render state initialized by _draw_label_strip.
+        self._font_family = self._DEFAULT_FAMILY
+        self._font_size = self.settings.default_font_size
+        self._current_font: tuple[str, float] | None = None
+        self._current_fill: colors.Color | None = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @classmethod
+    def paper_size_pts(cls, paper_size: PaperSize) -> tuple[float, float] | None:
+        """
+        Look up a paper size's (width, height) in points.
+
+        Args:
+            paper_size: The paper size to resolve
+
+        Returns:
+            (width, height) in points, or None if unknown
+        """
+        return _paper_sizes().get(paper_size)
+
     def generate_pdf(self, output_path: str, rotation_angle: float | None = None) -> bool:
         """
         Generate a PDF file from the label strip.
@@ -80,30 +162,15 @@ class PDFGenerator:
             if rotation_angle is None:
                 rotation_angle = self.settings.rotation_angle
 
-            paper_size = self.PAPER_SIZES.get(self.settings.paper_size, A4)
-            page_width, page_height = paper_size
-
-            c = canvas.Canvas(output_path, pagesize=paper_size)
+            c = self._canvas_module.Canvas(output_path, pagesize=self._page_size)
+            self._current_fill = None
 
             # Strip dimensions in ReportLab points
-            strip_width_pts = self.label_strip.get_total_width() * mm
-            strip_height_pts = self.label_strip.height * mm
-
-            # Centre within the printable area (margins applied)
-            margin_left = self.settings.page_margins.left * mm
-            margin_right = self.settings.page_margins.right * mm
-            margin_bottom = self.settings.page_margins.bottom * mm
-            margin_top = self.settings.page_margins.top * mm
-
-            available_width = page_width - margin_left - margin_right
-            available_height = page_height - margin_bottom - margin_top
-
-            # Centre of the printable area (ReportLab origin is bottom-left)
-            center_x = margin_left + available_width / 2
-            center_y = margin_bottom + available_height / 2
+            strip_width_pts = self.label_strip.get_total_width() * _MM
+            strip_height_pts = self.label_strip.height * _MM
 
             c.saveState()
-            c.translate(center_x, center_y)
+            c.translate(self._center_x, self._center_y)
             c.rotate(rotation_angle)
 
             # Draw strip centred at the (now-translated) origin
@@ -114,8 +181,8 @@ class PDFGenerator:
             c.restoreState()
             c.save()
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error("Error generating PDF: %s", e, exc_info=True)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error generating PDF")
             return False
         return True
 
@@ -123,16 +190,29 @@ class PDFGenerator:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _rl_color(self, color: Color) -> colors.Color:
+        """Return the cached reportlab Color for a model color."""
+        key = (color.r, color.g, color.b)
+        rl_color = self._color_cache.get(key)
+        if rl_color is None:
+            rl_color = self._colors.Color(color.r * _INV255, color.g * _INV255, color.b * _INV255)
+            self._color_cache[key] = rl_color
+        return rl_color
+
+    def _set_fill(self, canvas_obj: canvas.Canvas, rl_color: colors.Color) -> None:
+        """Emit setFillColor only when the fill actually changes.
+
+        The color cache returns one object per RGB triple, so an identity
+        check suffices and adjacent same-colored segments cost nothing.
+        """
+        if rl_color is not self._current_fill:
+            canvas_obj.setFillColor(rl_color)
+            self._current_fill = rl_color
+
     def _resolve_font(self, text_format: TextFormat) -> str:
         """Return the ReportLab font name for the configured font and format."""
         family = self._FONT_FAMILY_MAP.get(self.settings.default_font_name, self._DEFAULT_FAMILY)
-        if text_format == TextFormat.BOLD:
-            return family[1]
-        if text_format == TextFormat.ITALIC:
-            return family[2]
-        if text_format == TextFormat.BOLD_ITALIC:
-            return family[3]
-        return family[0]
+        return family[_FORMAT_INDEX.get(text_format, 0)]
 
     def _draw_label_strip(
         self,
@@ -143,21 +223,32 @@ class PDFGenerator:
         height: float,
     ) -> None:
         """Draw all segments of the label strip on the canvas."""
-        current_x = x
-
-        if self.label_strip.start_segment:
-            seg_w = self.label_strip.start_segment.width * mm
-            self._draw_segment(canvas_obj, current_x, y, seg_w, height, self.label_strip.start_segment)
-            current_x += seg_w
-
-        for segment in self.label_strip.content_segments:
-            seg_w = segment.width * mm
-            self._draw_segment(canvas_obj, current_x, y, seg_w, height, segment)
-            current_x += seg_w
-
-        if self.label_strip.end_segment:
-            seg_w = self.label_strip.end_segment.width * mm
-            self._draw_segment(canvas_obj, current_x, y, seg_w, height, self.label_strip.end_segment)
+        # Hoist state that is invariant for the whole strip: stroke color,
+        # line width, font family and size never change between segments.
+        canvas_obj.setStrokeColor(self._colors.black)
+        canvas_obj.setLineWidth(0.5)
+        self._font_family = self._FONT_FAMILY_MAP.get(self.settings.default_font_name, self._DEFAULT_FAMILY)
+        self._font_size = self.settings.default_font_size
+        self._current_font = None
+
+        # Start/end segments default to width 0; drawing them would still
+        # emit PDF operators for an invisible rect, so skip them outright.
+        segments: list[Segment] = []
+        start_segment = self.label_strip.start_segment
+        if start_segment is not None and start_segment.width > 0:
+            segments.append(start_segment)
+        segments.extend(self.label_strip.content_segments)
+        end_segment = self.label_strip.end_segment
+        if end_segment is not None and end_segment.width > 0:
+            segments.append(end_segment)
+
+        # Scale widths to points in one pass and derive every X offset with a
+        # C-level accumulate instead of serial += in the interpreter loop.
+        widths_pts = [segment.width * _MM for segment in segments]
+        xs = accumulate(widths_pts, initial=x)
+        # xs yields one extra trailing offset; zip stops at the shortest input.
+        for seg_x, seg_w, segment in zip(xs, widths_pts, segments, strict=False):
+            self._draw_segment(canvas_obj, seg_x, y, seg_w, height, segment)
 
     def _draw_segment(
         self,
@@ -169,42 +260,84 @@ class PDFGenerator:
         segment: Segment,
     ) -> None:
         """Draw a single segment (background, border, and text)."""
-        bg_color = colors.Color(
-            segment.background_color.r / 255.0,
-            segment.background_color.g / 255.0,
-            segment.background_color.b / 255.0,
-        )
-        text_color = colors.Color(
-            segment.text_color.r / 255.0,
-            segment.text_color.g / 255.0,
-            segment.text_color.b / 255.0,
-        )
-
-        # Background fill + thin border
-        canvas_obj.setFillColor(bg_color)
-        canvas_obj.setStrokeColor(colors.black)
-        canvas_obj.setLineWidth(0.5)
+        if width <= 0:
+            return
+
+        bg_color = self._rl_color(segment.background_color)
+        text_color = self._rl_color(segment.text_color)
+
+        # Background fill + thin border (stroke state set once per strip)
+        self._set_fill(canvas_obj, bg_color)
         canvas_obj.rect(x, y, width, height, fill=1, stroke=1)
 
         if not segment.text:
             return
 
-        canvas_obj.setFillColor(text_color)
+        self._set_fill(canvas_obj, text_color)
 
-        text_fmt = getattr(segment, "text_format", TextFormat.NORMAL) or TextFormat.NORMAL
-        font_name = self._resolve_font(text_fmt)
-        font_size = self.settings.default_font_size
+        text_fmt = segment.text_format or TextFormat.NORMAL
+        font_name = self._font_family[_FORMAT_INDEX.get(text_fmt, 0)]
+        font_size = self._font_size
 
-        canvas_obj.setFont(font_name, font_size)
+        # Only emit a setFont operator when the font actually changes.
+        if self._current_font != (font_name, font_size):
+            canvas_obj.setFont(font_name, font_size)
+            self._current_font = (font_name, font_size)
 
-        # Horizontal centre
-        text_width = canvas_obj.stringWidth(segment.text, font_name, font_size)
+        # Horizontal centre (stringWidth walks per-character metrics; memoize it)
+        key = (segment.text, font_name, font_size)
+        text_width = self._sw_cache.get(key)
+        if text_width is None:
+            text_width = canvas_obj.stringWidth(segment.text, font_name, font_size)
+            self._sw_cache[key] = text_width
         text_x = x + (width - text_width) / 2
 
         # Vertical centre using proper font metrics (ascent/descent in points)
-        ascent, descent = pdfmetrics.getAscentDescent(font_name, font_size)
+        ascent, descent = self._pdfmetrics.getAscentDescent(font_name, font_size)
         # ascent > 0, descent < 0; cap-height approximation: centre the text block
         text_block_height = ascent - descent
         text_y = y + (height - text_block_height) / 2 - descent
 
         canvas_obj.drawString(text_x, text_y, segment.text)
+
+
+class _PdfExportSignals(QObject):
+    """Signal carrier for StripPdfExportTask (QRunnable cannot emit directly)."""
+
+    finished = pyqtSignal(bool, str)
+
+
+class StripPdfExportTask(QRunnable):
+    """
+    Generates a label strip PDF on a QThreadPool worker.
+
+    A multi-page PDF render takes seconds for a long strip, and running it
+    on the GUI thread freezes the event loop for the duration. The task
+    works against a snapshot of the strip (a dict round-trip copy), so
+    concurrent edits in the designer cannot race the render.
+
+    Connect to ``signals.finished(success, output_path)`` before starting
+    the task, and keep a reference to the task until it fires.
+    """
+
+    def __init__(self, label_strip: LabelStrip, output_path: str):
+        """
+        Initialize the export task.
+
+        Args:
+            label_strip: The strip to render (snapshotted immediately)
+            output_path: Path where the PDF should be saved
+        """
+        super().__init__()
+        self._strip = LabelStrip.from_dict(label_strip.to_dict())
+        self._output_path = output_path
+        self.signals = _PdfExportSignals()
+
+    def run(self) -> None:
+        """Generate the PDF from the snapshot, then report the outcome."""
+        try:
+            success = PDFGenerator(self._strip).generate_pdf(self._output_path)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error generating PDF in background task")
+            success = False
+        self.signals.finished.emit(success, self._output_path)
@@ -2,11 +2,21 @@
 Project management utilities for saving and loading label strip projects.
 """
 
+import contextlib
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
-from PyQt6.QtCore import QSettings
+try:
+    # Optional accelerator: same fallback pattern as LabelStrip.to_json;
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # existing error handling covers both parsers.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback is always available
+    orjson = None  # type: ignore[assignment]
+
+from PyQt6.QtCore import QObject, QRunnable, QSettings, pyqtSignal
 
 from jackfield_labeler.models.label_strip import LabelStrip
 from jackfield_labeler.utils.logger import get_logger
@@ -14,6 +24,22 @@ from jackfield_labeler.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _cached_parse(path: str, mtime: float, size: int) -> dict[str, Any]:
+    """Parse a project file, keyed by (path, mtime, size) so edits invalidate.
+
+    File dialogs and previews probe the same file several times in a row
+    (is_valid_project_file, get_project_info, then load_project); the cache
+    turns those repeats into a single read and parse.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    result = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if not isinstance(result, dict):
+        raise TypeError(f"Expected JSON object in project file, got {type(result).__name__}")
+    return result
+
+
 class ProjectManager:
     """Manages saving and loading of label strip projects."""
 
@@ -48,8 +74,9 @@ class ProjectManager:
             True if saved successfully, False otherwise
         """
         try:
-            # Ensure the file has the correct extension
-            if not file_path.lower().endswith(ProjectManager.PROJECT_EXTENSION):
+            # Ensure the file has the correct extension (compare just the
+            # suffix instead of lowercasing the whole path)
+            if os.path.splitext(file_path)[1].lower() != ProjectManager.PROJECT_EXTENSION:
                 file_path += ProjectManager.PROJECT_EXTENSION
 
             # Create the project data structure
@@ -63,19 +90,36 @@ class ProjectManager:
                 },
             }
 
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            # Write the project file
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+            # Create directory if it doesn't exist (dirname is empty for a
+            # bare filename, which makedirs rejects)
+            parent = os.path.dirname(file_path)
+            if parent and not os.path.isdir(parent):
+                os.makedirs(parent, exist_ok=True)
+
+            # Write to a sibling temp file and atomically replace the target,
+            # so a crash mid-write never leaves a corrupt .jlp behind.  The
+            # large buffer coalesces json.dump's many small writes.
+            tmp_path = file_path + ".tmp"
+            try:
+                if orjson is not None:
+                    # orjson emits UTF-8 bytes directly
+                    with open(tmp_path, "wb", buffering=1 << 20) as f:
+                        f.write(orjson.dumps(project_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                        json.dump(project_data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, file_path)
+            except Exception:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
 
             # Save the directory
             ProjectManager.set_last_directory(file_path)
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except Exception:  # pylint: disable=broad-exception-caught
             # Catch all exceptions to ensure project save failures are logged
-            logger.error("Error saving project: %s", e, exc_info=True)
+            logger.exception("Error saving project")
             return False
         return True
 
@@ -91,13 +135,11 @@ class ProjectManager:
             The loaded LabelStrip instance, or None if loading failed
         """
         try:
-            if not os.path.exists(file_path):
+            project_data = ProjectManager._read_and_parse(file_path)
+            if project_data is None:
                 logger.warning("Project file not found: %s", file_path)
                 return None
 
-            with open(file_path, encoding="utf-8") as f:
-                project_data = json.load(f)
-
             # Validate project file format
             if not ProjectManager._validate_project_data(project_data):
                 logger.warning("Invalid project file format")
@@ -116,13 +158,30 @@ class ProjectManager:
             else:
                 return None
 
-        except json.JSONDecodeError as e:
-            logger.error("Error parsing project file: %s", e, exc_info=True)
+        except json.JSONDecodeError:
+            logger.exception("Error parsing project file")
             return None
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except Exception:  # pylint: disable=broad-exception-caught
             # Catch all exceptions to ensure project load failures are logged
-            logger.error("Error loading project: %s", e, exc_info=True)
+            logger.exception("Error loading project")
+            return None
+
+    @staticmethod
+    def _read_and_parse(file_path: str) -> dict[str, Any] | None:
+        """
+        Read and parse a project file through the mtime/size-keyed cache.
+
+        Args:
+            file_path: Path to the project file
+
+        Returns:
+            Parsed project data, or None if the file does not exist
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return None
+        return _cached_parse(file_path, st.st_mtime, st.st_size)
 
     @staticmethod
     def _validate_project_data(data: dict[str, Any]) -> bool:
@@ -167,12 +226,10 @@ class ProjectManager:
             Dictionary with project info, or None if file can't be read
         """
         try:
-            if not os.path.exists(file_path):
+            project_data = ProjectManager._read_and_parse(file_path)
+            if project_data is None:
                 return None
 
-            with open(file_path, encoding="utf-8") as f:
-                project_data = json.load(f)
-
             # Extract basic info
             info = {
                 "version": project_data.get("version", "Unknown"),
@@ -189,9 +246,9 @@ class ProjectManager:
                     "content_cell_width": label_strip_data.get("content_cell_width", 0),
                     "segment_count": len(label_strip_data.get("segments", [])),
                 })
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except Exception:  # pylint: disable=broad-exception-caught
             # Catch all exceptions to ensure project info read failures are logged
-            logger.error("Error reading project info: %s", e, exc_info=True)
+            logger.exception("Error reading project info")
             return None
         return info
 
@@ -207,7 +264,7 @@ class ProjectManager:
             True if valid project file, False otherwise
         """
         try:
-            if not file_path.lower().endswith(ProjectManager.PROJECT_EXTENSION):
+            if os.path.splitext(file_path)[1].lower() != ProjectManager.PROJECT_EXTENSION:
                 return False
 
             info = ProjectManager.get_project_info(file_path)
@@ -216,3 +273,86 @@ class ProjectManager:
         except Exception:  # pylint: disable=broad-exception-caught
             # Catch all exceptions during validation to return False safely
             return False
+
+
+class _ProjectSaveSignals(QObject):
+    """Signal carrier for ProjectSaveTask (QRunnable cannot emit directly)."""
+
+    finished = pyqtSignal(bool, str)
+
+
+class ProjectSaveTask(QRunnable):
+    """
+    Saves a label strip project on a QThreadPool worker.
+
+    Serializing and writing a large project blocks on disk I/O; running it
+    on the GUI thread stalls the event loop. The task works against a
+    snapshot of the strip (a dict round-trip copy), so concurrent edits in
+    the designer cannot race the write.
+
+    Connect to ``signals.finished(success, file_path)`` before starting
+    the task, and keep a reference to the task until it fires.
+    """
+
+    def __init__(self, label_strip: LabelStrip, file_path: str):
+        """
+        Initialize the save task.
+
+        Args:
+            label_strip: The strip to save (snapshotted immediately)
+            file_path: Path where the project should be saved
+        """
+        super().__init__()
+        self._strip = LabelStrip.from_dict(label_strip.to_dict())
+        self._file_path = file_path
+        self.signals = _ProjectSaveSignals()
+
+    def run(self) -> None:
+        """Save the snapshot, then report the outcome."""
+        try:
+            success = ProjectManager.save_project(self._strip, self._file_path)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error saving project in background task")
+            success = False
+        self.signals.finished.emit(success, self._file_path)
+
+
+class _ProjectLoadSignals(QObject):
+    """Signal carrier for ProjectLoadTask (QRunnable cannot emit directly)."""
+
+    # The first argument is the loaded LabelStrip, or None on failure;
+    # pyqtSignal cannot express the union, so it is typed as object.
+    finished = pyqtSignal(object, str)
+
+
+class ProjectLoadTask(QRunnable):
+    """
+    Loads a label strip project on a QThreadPool worker.
+
+    Reading and parsing a project file blocks on disk I/O; the task moves
+    that off the GUI thread and delivers the constructed LabelStrip (or
+    None on failure) through its finished signal.
+
+    Connect to ``signals.finished(label_strip, file_path)`` before
+    starting the task, and keep a reference to the task until it fires.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the load task.
+
+        Args:
+            file_path: Path to the project file to load
+        """
+        super().__init__()
+        self._file_path = file_path
+        self.signals = _ProjectLoadSignals()
+
+    def run(self) -> None:
+        """Load the project, then deliver the result (or None)."""
+        try:
+            label_strip = ProjectManager.load_project(self._file_path)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error loading project in background task")
+            label_strip = None
+        self.signals.finished.emit(label_strip, self._file_path)
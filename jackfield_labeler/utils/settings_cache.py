@@ -0,0 +1,74 @@
+"""
+In-memory cache in front of QSettings.
+
+Every QSettings.value() call hits the registry (Windows) or parses an INI
+file (elsewhere).  Routing reads through this cache turns repeated lookups
+into dict hits, and writes only touch the persistent store when the value
+actually changed.
+"""
+
+from typing import Any, ClassVar
+
+from jackfield_labeler.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ORGANIZATION = "capp3"
+_APPLICATION = "Jackfield Labeler"
+
+
+class SettingsCache:
+    """Dict-backed cache over the application's QSettings store."""
+
+    _cache: ClassVar[dict[str, Any]] = {}
+
+    @staticmethod
+    def _qsettings() -> Any:
+        """Open the application QSettings store (QtCore imported on demand)."""
+        from PyQt6.QtCore import QSettings  # pylint: disable=import-outside-toplevel
+
+        return QSettings(_ORGANIZATION, _APPLICATION)
+
+    @classmethod
+    def get(cls, key: str, default: Any = None, value_type: type | None = None) -> Any:
+        """
+        Get a settings value, reading the persistent store only on first access.
+
+        Args:
+            key: Settings key (e.g. "logging/level")
+            default: Value returned when the key is unset
+            value_type: Expected type, forwarded to QSettings.value()
+
+        Returns:
+            The cached or freshly read value
+        """
+        if key in cls._cache:
+            return cls._cache[key]
+
+        settings = cls._qsettings()
+        if value_type is not None:
+            value = settings.value(key, default, type=value_type)
+        else:
+            value = settings.value(key, default)
+        cls._cache[key] = value
+        return value
+
+    @classmethod
+    def set(cls, key: str, value: Any) -> None:
+        """
+        Set a settings value, writing the persistent store only on real change.
+
+        Args:
+            key: Settings key
+            value: New value
+        """
+        if key in cls._cache and cls._cache[key] == value:
+            return
+
+        cls._cache[key] = value
+        cls._qsettings().setValue(key, value)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached values so the next reads hit the persistent store."""
+        cls._cache.clear()
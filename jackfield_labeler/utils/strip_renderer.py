@@ -2,8 +2,12 @@
 Strip rendering utilities for preview and PNG export.
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from functools import lru_cache
+from itertools import accumulate
+from typing import ClassVar
+
+from PyQt6.QtCore import QObject, QRect, QRunnable, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QImage, QPainter, QPen, QPixmap
 
 from jackfield_labeler.models.label_strip import LabelStrip
 from jackfield_labeler.models.segment import Segment
@@ -12,10 +16,28 @@ from jackfield_labeler.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Points to millimetres (font sizes are in pt, strip geometry in mm).
+_PT_TO_MM = 25.4 / 72.0
+
+
+@lru_cache(maxsize=256)
+def _qcolor(r: int, g: int, b: int) -> QColor:
+    """Return a shared QColor per RGB triple (treated as immutable)."""
+    return QColor(r, g, b)
+
 
 class StripRenderer:
     """Renders label strips to various formats."""
 
+    # Shared placeholder returned for empty strips; built lazily because a
+    # QPixmap cannot exist before the QApplication does. The empty path runs
+    # on every repaint at startup, so avoid allocating a pixmap each time.
+    _EMPTY_PIXMAP: ClassVar[QPixmap | None] = None
+
+    # Every border in every strip uses the same 1px black pen; unlike pixmaps
+    # a QPen is a plain value type, safe to build at import time.
+    _BORDER_PEN: ClassVar[QPen] = QPen(Qt.GlobalColor.black, 1)
+
     def __init__(self, label_strip: LabelStrip, scale_factor: float = 10.0):
         """
         Initialize the strip renderer.
@@ -26,6 +48,24 @@ class StripRenderer:
         """
         self.label_strip = label_strip
         self.scale_factor = scale_factor
+        # Most segments share one format/size, so cache the QFont (and its
+        # QFontMetrics) per (text_format, pixel_size) instead of rebuilding
+        # and re-resolving them for every segment.
+        self._font_cache: dict[tuple[TextFormat, int], tuple[QFont, QFontMetrics]] = {}
+        # Key of the font currently set on the painter for this pass.
+        self._last_font_key: tuple[TextFormat, int] | None = None
+        # Short labels repeat across segments and repaints; memoize their
+        # measured advance per font so repeated strings skip text shaping.
+        self._text_width_cache: dict[tuple[tuple[TextFormat, int], str], int] = {}
+        # setPen(QColor) builds a throwaway QPen internally; keep one per
+        # text color instead (palettes are tiny, like the QColor cache).
+        self._pen_cache: dict[tuple[int, int, int], QPen] = {}
+        # Persistent backing pixmap for render_to_pixmap: when only some
+        # segments changed since the last render, just their x-ranges are
+        # repainted instead of rasterizing the whole strip again.
+        self._cached_pixmap: QPixmap | None = None
+        self._cached_dims: tuple[int, int, float, str, float] | None = None
+        self._cached_fingerprints: list[tuple] | None = None
 
     def render_to_pixmap_on_page(self, page_width_px: int, page_height_px: int) -> QPixmap:
         """
@@ -57,8 +97,11 @@ class StripRenderer:
         painter.rotate(self.label_strip.settings.rotation_angle)
         painter.translate(-strip_width_px / 2, -strip_height_px / 2)
 
-        # Draw the strip
-        self._draw_strip(painter, 0, 0, strip_width_px, strip_height_px)
+        # Composite the (incrementally cached) strip raster onto the page so
+        # interactive edits only re-rasterize the segments that changed.
+        if strip_width_px > 0:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(0, 0, self.render_to_pixmap())
 
         painter.end()
         return pixmap
@@ -67,59 +110,175 @@ class StripRenderer:
         """
         Render the strip to a QPixmap.
 
+        Reuses a persistent backing pixmap across calls: when the strip's
+        geometry is unchanged and only some segments' content differs from
+        the previous render, just those segments are repainted.
+
         Returns:
             QPixmap containing the rendered strip
         """
-        if not self.label_strip or self.label_strip.get_total_width() == 0:
-            return QPixmap(100, 50)
+        strip_width_mm = self.label_strip.get_total_width() if self.label_strip else 0.0
+        if strip_width_mm == 0:
+            if StripRenderer._EMPTY_PIXMAP is None:
+                empty = QPixmap(100, 50)
+                empty.fill(Qt.GlobalColor.white)
+                StripRenderer._EMPTY_PIXMAP = empty
+            return StripRenderer._EMPTY_PIXMAP
 
-        strip_width_mm = self.label_strip.get_total_width()
         strip_height_mm = self.label_strip.height
         width_px = int(strip_width_mm * self.scale_factor)
         height_px = int(strip_height_mm * self.scale_factor)
 
+        settings = self.label_strip.settings
+        dims = (width_px, height_px, self.scale_factor, settings.default_font_name, settings.default_font_size)
+        fingerprints = self._segment_fingerprints()
+
+        if (
+            self._cached_pixmap is not None
+            and self._cached_dims == dims
+            and self._cached_fingerprints is not None
+            and len(fingerprints) == len(self._cached_fingerprints)
+            # Widths must match, otherwise later segments shift position.
+            and all(a[1] == b[1] for a, b in zip(fingerprints, self._cached_fingerprints, strict=True))
+        ):
+            dirty = [
+                i for i, (a, b) in enumerate(zip(fingerprints, self._cached_fingerprints, strict=True)) if a != b
+            ]
+            if dirty:
+                self._redraw_segments(self._cached_pixmap, dirty, height_px)
+            self._cached_fingerprints = fingerprints
+            return self._cached_pixmap
+
         pixmap = QPixmap(width_px, height_px)
         pixmap.fill(Qt.GlobalColor.white)
 
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Shape antialiasing is left off: every rect is integer-aligned, so
+        # AA would only pay per-pixel coverage cost to blur shared edges.
+        # Glyphs do benefit, hence the text-only hint.
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
         self._draw_strip(painter, 0, 0, width_px, height_px)
         painter.end()
+
+        self._cached_pixmap = pixmap
+        self._cached_dims = dims
+        self._cached_fingerprints = fingerprints
         return pixmap
 
-    def save_to_png(self, output_path: str, dpi: int = 300) -> bool:
+    def invalidate(self) -> None:
+        """Drop the cached backing pixmap; the next render rebuilds fully."""
+        self._cached_pixmap = None
+        self._cached_dims = None
+        self._cached_fingerprints = None
+
+    def _visible_segments(self) -> list[Segment]:
+        """Return the drawable segments in strip order (zero-width start/end skipped)."""
+        segments: list[Segment] = []
+        if self.label_strip.start_segment and self.label_strip.start_segment.width > 0:
+            segments.append(self.label_strip.start_segment)
+        segments.extend(self.label_strip.content_segments)
+        if self.label_strip.end_segment and self.label_strip.end_segment.width > 0:
+            segments.append(self.label_strip.end_segment)
+        return segments
+
+    @staticmethod
+    def _segment_layout(segments: list[Segment], x: int, scale: float) -> tuple[list[int], list[int]]:
+        """
+        Compute every segment's pixel x-offset and width in one pass.
+
+        Scaling and accumulation happen up front (the running sum via a
+        C-level accumulate) so the drawing loops work from plain integer
+        lists instead of repeating float multiply + int casts per segment.
+
+        Args:
+            segments: Visible segments in strip order
+            x: Pixel x-offset of the first segment
+            scale: Scale factor (pixels per mm)
+
+        Returns:
+            (x_offsets, widths) in pixels, parallel to ``segments``
+        """
+        widths_px = [int(segment.width * scale) for segment in segments]
+        # accumulate yields one extra trailing offset; drop it.
+        offsets = list(accumulate(widths_px, initial=x))[:-1] if widths_px else []
+        return offsets, widths_px
+
+    def _segment_fingerprints(self) -> list[tuple]:
+        """Build a comparable snapshot of everything that affects each segment's pixels."""
+        return [
+            (
+                segment.id,
+                segment.width,
+                segment.text,
+                segment.text_format,
+                segment.background_color.to_hex(),
+                segment.text_color.to_hex(),
+            )
+            for segment in self._visible_segments()
+        ]
+
+    def _redraw_segments(self, pixmap: QPixmap, indices: list[int], height_px: int) -> None:
+        """
+        Repaint only the given segment indices onto the cached pixmap.
+
+        Args:
+            pixmap: The backing pixmap to paint on
+            indices: Indices into the visible segment list to redraw
+            height_px: Strip height in pixels
+        """
+        segments = self._visible_segments()
+        scale = self.scale_factor
+
+        # Segment geometry mirrors the full-draw pass (ints, left to right).
+        offsets, widths_px = self._segment_layout(segments, 0, scale)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        for i in indices:
+            painter.fillRect(offsets[i], 0, widths_px[i], height_px, Qt.GlobalColor.white)
+            self._draw_segment(painter, offsets[i], 0, widths_px[i], height_px, segments[i], scale)
+        painter.end()
+
+    def save_to_png(self, output_path: str, dpi: int = 300, quality: int = 90) -> bool:
         """
         Save the strip as a PNG file.
 
         Args:
             output_path: Path where the PNG should be saved
             dpi: DPI for the output image (default 300)
+            quality: PNG encoder quality hint (Qt maps high values to a low
+                zlib compression level). Label strips are flat-colored
+                rectangles that deflate well even at the fastest level, so
+                the default trades a few percent of file size for a much
+                faster export; pass 0 for maximum compression.
 
         Returns:
             True if PNG was saved successfully, False otherwise
         """
         try:
-            if not self.label_strip or self.label_strip.get_total_width() == 0:
+            strip_width_mm = self.label_strip.get_total_width() if self.label_strip else 0.0
+            if strip_width_mm == 0:
                 return False
 
             # 1 inch = 25.4 mm  →  pixels per mm = dpi / 25.4
             png_scale_factor = dpi / 25.4
 
-            strip_width_mm = self.label_strip.get_total_width()
             strip_height_mm = self.label_strip.height
             width_px = int(strip_width_mm * png_scale_factor)
             height_px = int(strip_height_mm * png_scale_factor)
 
-            pixmap = QPixmap(width_px, height_px)
-            pixmap.fill(Qt.GlobalColor.white)
+            # Paint straight into an RGB32 QImage: the strip is opaque, so
+            # the alpha-premultiplied default buys nothing, and skipping the
+            # QPixmap round-trip avoids an extra full-size copy before save.
+            image = QImage(width_px, height_px, QImage.Format.Format_RGB32)
+            image.fill(Qt.GlobalColor.white)
 
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter = QPainter(image)
             painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
             self._draw_strip_scaled(painter, 0, 0, width_px, height_px, png_scale_factor)
             painter.end()
 
-            return pixmap.save(output_path, "PNG")
+            return image.save(output_path, "PNG", quality)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Error saving PNG: %s", e, exc_info=True)
@@ -133,6 +292,11 @@ class StripRenderer:
         """
         Draw the strip with a specific scale factor.
 
+        Segments are gathered first and then drawn in three batched phases
+        (background fills grouped by color, all borders under one pen, text
+        grouped by font and color) so painter state changes scale with the
+        number of distinct styles rather than the number of segments.
+
         Args:
             painter: QPainter to draw with
             x: X position in pixels
@@ -141,21 +305,15 @@ class StripRenderer:
             height: Total height in pixels
             scale: Scale factor (pixels per mm)
         """
-        current_x = x
+        segments = self._visible_segments()
 
-        if self.label_strip.start_segment and self.label_strip.start_segment.width > 0:
-            segment_width_px = int(self.label_strip.start_segment.width * scale)
-            self._draw_segment(painter, current_x, y, segment_width_px, height, self.label_strip.start_segment, scale)
-            current_x += segment_width_px
+        offsets, widths_px = self._segment_layout(segments, x, scale)
+        segment_rects: list[tuple[QRect, Segment]] = [
+            (QRect(seg_x, y, seg_w, height), segment)
+            for seg_x, seg_w, segment in zip(offsets, widths_px, segments, strict=True)
+        ]
 
-        for segment in self.label_strip.content_segments:
-            segment_width_px = int(segment.width * scale)
-            self._draw_segment(painter, current_x, y, segment_width_px, height, segment, scale)
-            current_x += segment_width_px
-
-        if self.label_strip.end_segment and self.label_strip.end_segment.width > 0:
-            segment_width_px = int(self.label_strip.end_segment.width * scale)
-            self._draw_segment(painter, current_x, y, segment_width_px, height, self.label_strip.end_segment, scale)
+        self._draw_segments_batched(painter, segment_rects, scale)
 
     def _draw_segment(
         self,
@@ -168,7 +326,7 @@ class StripRenderer:
         scale: float,
     ) -> None:
         """
-        Draw a single segment.
+        Draw a single segment (used for targeted redraws).
 
         Args:
             painter: QPainter to draw with
@@ -179,41 +337,143 @@ class StripRenderer:
             segment: The segment to draw
             scale: Scale factor (pixels per mm), used for font sizing
         """
-        bg_color = QColor(segment.background_color.r, segment.background_color.g, segment.background_color.b)
-        text_color = QColor(segment.text_color.r, segment.text_color.g, segment.text_color.b)
-
-        painter.fillRect(x, y, width, height, bg_color)
-        painter.setPen(QPen(Qt.GlobalColor.black, 1))
-        painter.drawRect(x, y, width, height)
-
-        if segment.text:
-            painter.setPen(text_color)
+        self._draw_segments_batched(painter, [(QRect(x, y, width, height), segment)], scale)
 
-            # Convert pt -> px: pixels = points * (scale px/mm) * (25.4 mm/in) / (72 pt/in)
-            font_size_px = int(self.label_strip.settings.default_font_size * scale * 25.4 / 72)
-            font = QFont(self.label_strip.settings.default_font_name)
-            font.setPixelSize(max(1, font_size_px))
-
-            text_fmt = getattr(segment, "text_format", None)
-            if text_fmt == TextFormat.BOLD:
-                font.setBold(True)
-            elif text_fmt == TextFormat.ITALIC:
-                font.setItalic(True)
-            elif text_fmt == TextFormat.BOLD_ITALIC:
-                font.setBold(True)
-                font.setItalic(True)
+    def _draw_segments_batched(
+        self,
+        painter: QPainter,
+        segment_rects: list[tuple[QRect, Segment]],
+        scale: float,
+    ) -> None:
+        """
+        Draw pre-positioned segments in three state-batched phases.
 
-            painter.setFont(font)
+        Args:
+            painter: QPainter to draw with
+            segment_rects: (rectangle, segment) pairs in strip order
+            scale: Scale factor (pixels per mm), used for font sizing
+        """
+        # Font size is uniform across the strip; compute it once.
+        # Convert pt -> px: pixels = points * (25.4/72 mm/pt) * (scale px/mm)
+        font_size_px = max(1, int(self.label_strip.settings.default_font_size * _PT_TO_MM * scale))
+
+        bg_by_color: dict[tuple[int, int, int], tuple[QColor, list[QRect]]] = {}
+        border_rects: list[QRect] = []
+        text_by_style: dict[
+            tuple[tuple[TextFormat, int], tuple[int, int, int]],
+            tuple[QColor, list[tuple[QRect, str]]],
+        ] = {}
+
+        # Real jackfields are dominated by one style (normal black-on-white),
+        # so segments overwhelmingly repeat their neighbour's keys; remember
+        # the previous segment's buckets to skip the dict lookups on runs.
+        prev_bg_key: tuple[int, int, int] | None = None
+        prev_bg_rects: list[QRect] | None = None
+        prev_style_key: tuple[tuple[TextFormat, int], tuple[int, int, int]] | None = None
+        prev_style_jobs: list[tuple[QRect, str]] | None = None
+
+        for rect, segment in segment_rects:
+            bg = segment.background_color
+            bg_key = (bg.r, bg.g, bg.b)
+            if bg_key == prev_bg_key and prev_bg_rects is not None:
+                prev_bg_rects.append(rect)
+            else:
+                bg_entry = bg_by_color.get(bg_key)
+                if bg_entry is None:
+                    bg_by_color[bg_key] = bg_entry = (_qcolor(bg.r, bg.g, bg.b), [rect])
+                else:
+                    bg_entry[1].append(rect)
+                prev_bg_key = bg_key
+                prev_bg_rects = bg_entry[1]
+
+            border_rects.append(rect)
+
+            if segment.text:
+                fg = segment.text_color
+                text_fmt = segment.text_format or TextFormat.NORMAL
+                style_key = ((text_fmt, font_size_px), (fg.r, fg.g, fg.b))
+                if style_key == prev_style_key and prev_style_jobs is not None:
+                    prev_style_jobs.append((rect, segment.text))
+                else:
+                    text_entry = text_by_style.get(style_key)
+                    if text_entry is None:
+                        text_by_style[style_key] = text_entry = (_qcolor(fg.r, fg.g, fg.b), [(rect, segment.text)])
+                    else:
+                        text_entry[1].append((rect, segment.text))
+                    prev_style_key = style_key
+                    prev_style_jobs = text_entry[1]
+
+        # Geometry is integer-aligned, so antialiasing the fills/borders only
+        # smears shared edges (and makes overlapping strokes composite
+        # non-deterministically for the incremental redraw path); draw the
+        # rect phases crisp and restore the hint for any later painting.
+        aa_was_on = bool(painter.renderHints() & QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+        # Phase 1: background fills, grouped by color
+        for bg_color, rects in bg_by_color.values():
+            for rect in rects:
+                painter.fillRect(rect, bg_color)
+
+        # Phase 2: all borders under a single shared pen
+        painter.setPen(self._BORDER_PEN)
+        painter.drawRects(border_rects)
+
+        if aa_was_on:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        # Phase 3: text, grouped by (font, color)
+        self._last_font_key = None
+        for (font_key, rgb), (text_color, jobs) in text_by_style.items():
+            font, metrics = self._get_font(font_key)
+            if font_key != self._last_font_key:
+                painter.setFont(font)
+                self._last_font_key = font_key
+            pen = self._pen_cache.get(rgb)
+            if pen is None:
+                pen = QPen(text_color)
+                self._pen_cache[rgb] = pen
+            painter.setPen(pen)
 
-            metrics = painter.fontMetrics()
-            text_width = metrics.horizontalAdvance(segment.text)
             text_height = metrics.height()
+            descent = metrics.descent()
+            for rect, text in jobs:
+                width_key = (font_key, text)
+                text_width = self._text_width_cache.get(width_key)
+                if text_width is None:
+                    if len(self._text_width_cache) >= 2048:
+                        # Crude bound; distinct labels rarely get anywhere near this.
+                        self._text_width_cache.clear()
+                    text_width = metrics.horizontalAdvance(text)
+                    self._text_width_cache[width_key] = text_width
+
+                # Horizontally centred; baseline-aware vertical centre
+                text_x = rect.x() + (rect.width() - text_width) / 2
+                text_y = rect.y() + (rect.height() + text_height) / 2 - descent
+                painter.drawText(int(text_x), int(text_y), text)
+
+    def _get_font(self, font_key: tuple[TextFormat, int]) -> tuple[QFont, QFontMetrics]:
+        """
+        Get the cached (QFont, QFontMetrics) pair for a format/size key.
 
-            # Horizontally centred; baseline-aware vertical centre
-            text_x = x + (width - text_width) / 2
-            text_y = y + (height + text_height) / 2 - metrics.descent()
+        Args:
+            font_key: (text_format, pixel_size) key
 
-            painter.drawText(int(text_x), int(text_y), segment.text)
+        Returns:
+            The cached font and its metrics
+        """
+        cached = self._font_cache.get(font_key)
+        if cached is None:
+            text_fmt, font_size_px = font_key
+            font = QFont(self.label_strip.settings.default_font_name)
+            font.setPixelSize(font_size_px)
+            if text_fmt in (TextFormat.BOLD, TextFormat.BOLD_ITALIC):
+                font.setBold(True)
+            if text_fmt in (TextFormat.ITALIC, TextFormat.BOLD_ITALIC):
+                font.setItalic(True)
+            cached = (font, QFontMetrics(font))
+            self._font_cache[font_key] = cached
+        return cached
 
     def get_strip_dimensions_px(self) -> tuple[int, int]:
         """
@@ -240,3 +500,51 @@ class StripRenderer:
             return (0.0, 0.0)
 
         return (self.label_strip.get_total_width(), self.label_strip.height)
+
+
+class _PngExportSignals(QObject):
+    """Signal carrier for StripPngExportTask (QRunnable cannot emit directly)."""
+
+    finished = pyqtSignal(bool, str)
+
+
+class StripPngExportTask(QRunnable):
+    """
+    Renders a label strip to PNG on a QThreadPool worker.
+
+    A 300 DPI export of a long strip rasterizes tens of millions of pixels;
+    doing that synchronously freezes the GUI for seconds. QPainter on a
+    QImage is safe off the GUI thread, so the whole raster-and-save pass
+    runs on a worker against a snapshot of the strip (a dict round-trip
+    copy, so concurrent edits in the designer cannot race the render).
+
+    Connect to ``signals.finished(success, output_path)`` before starting
+    the task, and keep a reference to the task until it fires.
+    """
+
+    def __init__(self, label_strip: LabelStrip, output_path: str, dpi: int = 300, quality: int = 90):
+        """
+        Initialize the export task.
+
+        Args:
+            label_strip: The strip to export (snapshotted immediately)
+            output_path: Path where the PNG should be saved
+            dpi: DPI for the output image (default 300)
+            quality: PNG encoder quality hint (see StripRenderer.save_to_png)
+        """
+        super().__init__()
+        self._strip = LabelStrip.from_dict(label_strip.to_dict())
+        self._output_path = output_path
+        self._dpi = dpi
+        self._quality = quality
+        self.signals = _PngExportSignals()
+
+    def run(self) -> None:
+        """Render and save the snapshot, then report the outcome."""
+        try:
+            renderer = StripRenderer(self._strip)
+            success = renderer.save_to_png(self._output_path, self._dpi, self._quality)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Error exporting PNG in background task")
+            success = False
+        self.signals.finished.emit(success, self._output_path)
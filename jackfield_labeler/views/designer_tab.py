@@ -5,11 +5,13 @@ Designer tab for creating and editing label strips.
 import os
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
     QFileDialog,
+    QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
@@ -18,6 +20,8 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSpinBox,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
@@ -30,7 +34,112 @@ else:
     QWidgetType = QWidget  # Runtime alias for type annotations
 
 from jackfield_labeler.models import Color, LabelStrip, Segment, StandardColor, TextFormat
-from jackfield_labeler.utils import PDFGenerator, ProjectManager, StripRenderer
+from jackfield_labeler.utils import (
+    ProjectLoadTask,
+    ProjectManager,
+    ProjectSaveTask,
+    StripPdfExportTask,
+    StripPngExportTask,
+)
+
+# Item models shared by every row's comboboxes: the format/color choices are
+# identical for all rows, so build them once instead of per-row addItem loops.
+_FORMAT_MODEL: QStandardItemModel | None = None
+_COLOR_MODEL: QStandardItemModel | None = None
+
+# Enum value -> model row, so editors can select an option without scanning.
+_FORMAT_ROWS = {fmt: i for i, fmt in enumerate(TextFormat)}
+_COLOR_ROWS = {color: i for i, color in enumerate(StandardColor)}
+
+# Enum value -> display label, computed once; str(fmt)/name.title() are
+# Python-level string calls otherwise repeated for every populated row.
+_FORMAT_LABELS = {fmt: str(fmt) for fmt in TextFormat}
+_COLOR_LABELS = {color: color.name.title() for color in StandardColor}
+
+
+def _build_enum_model(entries: list[tuple[str, object]]) -> QStandardItemModel:
+    """Build a combobox model whose items carry enum values in the user role."""
+    model = QStandardItemModel()
+    for label, value in entries:
+        item = QStandardItem(label)
+        item.setData(value, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
+
+
+def _shared_combo_models() -> tuple[QStandardItemModel, QStandardItemModel]:
+    """Lazily build (once) and return the shared format and color models."""
+    global _FORMAT_MODEL, _COLOR_MODEL  # pylint: disable=global-statement
+    if _FORMAT_MODEL is None or _COLOR_MODEL is None:
+        _FORMAT_MODEL = _build_enum_model([(label, fmt) for fmt, label in _FORMAT_LABELS.items()])
+        _COLOR_MODEL = _build_enum_model([(label, color) for color, label in _COLOR_LABELS.items()])
+    return _FORMAT_MODEL, _COLOR_MODEL
+
+
+class EnumComboDelegate(QStyledItemDelegate):
+    """Edits enum-valued cells with a combobox created only while editing.
+
+    Cells store the display name as item text and the enum in the user
+    role; the combobox exists solely for the cell currently being edited,
+    so viewing a table costs no editor widgets at all.
+    """
+
+    def __init__(
+        self,
+        model: QStandardItemModel,
+        rows_by_value: dict[TextFormat, int] | dict[StandardColor, int],
+        parent: QWidgetType | None = None,
+    ) -> None:
+        """
+        Initialize the delegate.
+
+        Args:
+            model: Shared item model holding the enum options
+            rows_by_value: Model row for each enum value
+        """
+        super().__init__(parent)
+        self._model = model
+        self._rows_by_value = rows_by_value
+
+    def createEditor(  # pylint: disable=invalid-name
+        self,
+        parent: QWidgetType | None,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> QWidget:
+        """Create a combobox over the shared option model."""
+        combo = QComboBox(parent)
+        combo.setModel(self._model)
+        # Commit as soon as an option is picked instead of waiting for
+        # focus-out, matching how the old persistent combos behaved.
+        combo.activated.connect(self._commit_editor)  # type: ignore[attr-defined]
+        return combo
+
+    def setEditorData(self, editor: QWidget | None, index: QModelIndex) -> None:  # pylint: disable=invalid-name
+        """Select the option matching the cell's current enum value."""
+        if not isinstance(editor, QComboBox):
+            return
+        editor.setCurrentIndex(self._rows_by_value.get(index.data(Qt.ItemDataRole.UserRole), 0))
+
+    def setModelData(  # pylint: disable=invalid-name
+        self,
+        editor: QWidget | None,
+        model: QAbstractItemModel | None,
+        index: QModelIndex,
+    ) -> None:
+        """Write the chosen option's label and enum back to the cell."""
+        if not isinstance(editor, QComboBox) or model is None:
+            return
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.DisplayRole)
+        model.setData(index, editor.currentData(), Qt.ItemDataRole.UserRole)
+
+    @pyqtSlot()
+    def _commit_editor(self) -> None:
+        """Commit and close the editor that emitted activated."""
+        editor = self.sender()
+        if isinstance(editor, QWidget):
+            self.commitData.emit(editor)
+            self.closeEditor.emit(editor)
 
 
 class StripControlPanel(QGroupBox):
@@ -41,99 +150,82 @@ class StripControlPanel(QGroupBox):
     def __init__(self, parent: QWidgetType | None = None) -> None:
         """Initialize the strip control panel."""
         super().__init__("🎛️ Strip Controls", parent)
-        self.setLayout(QVBoxLayout())
-        self.layout().setSpacing(12)
-        self.layout().setContentsMargins(16, 20, 16, 16)
+        # One QFormLayout instead of six QHBoxLayout+QLabel rows: fewer
+        # widgets/layouts to construct and a single relayout pass; updates
+        # are suppressed until the panel is fully assembled.
+        self.setUpdatesEnabled(False)
+
+        layout = QFormLayout()
+        layout.setSpacing(12)
+        layout.setContentsMargins(16, 20, 16, 16)
+        self.setLayout(layout)
 
         # Content cells control
-        cells_layout = QHBoxLayout()
-        cells_layout.setSpacing(8)
-        cells_label = QLabel("Number of Content Cells:")
-        cells_label.setMinimumWidth(180)
-        cells_layout.addWidget(cells_label)
         self.content_cells_spinbox = QSpinBox()
         self.content_cells_spinbox.setRange(0, 100)
         self.content_cells_spinbox.setValue(0)
         self.content_cells_spinbox.setMinimumWidth(100)
         self.content_cells_spinbox.valueChanged.connect(self._emit_changed)  # type: ignore[attr-defined]
-        cells_layout.addWidget(self.content_cells_spinbox)
-        cells_layout.addStretch()
-        self.layout().addLayout(cells_layout)
+        layout.addRow("Number of Content Cells:", self.content_cells_spinbox)
 
         # Cell width control
-        cell_width_layout = QHBoxLayout()
-        cell_width_layout.setSpacing(8)
-        cell_width_label = QLabel("Content Cell Width (mm):")
-        cell_width_label.setMinimumWidth(180)
-        cell_width_layout.addWidget(cell_width_label)
         self.cell_width_spinbox = QDoubleSpinBox()
         self.cell_width_spinbox.setRange(0.001, 100.0)
         self.cell_width_spinbox.setDecimals(3)
         self.cell_width_spinbox.setValue(10.0)
         self.cell_width_spinbox.setMinimumWidth(100)
         self.cell_width_spinbox.valueChanged.connect(self._emit_changed)  # type: ignore[attr-defined]
-        cell_width_layout.addWidget(self.cell_width_spinbox)
-        cell_width_layout.addStretch()
-        self.layout().addLayout(cell_width_layout)
+        layout.addRow("Content Cell Width (mm):", self.cell_width_spinbox)
 
         # End label width control
-        end_width_layout = QHBoxLayout()
-        end_width_layout.setSpacing(8)
-        end_width_label = QLabel("End Label Width (both ends, mm):")
-        end_width_label.setMinimumWidth(180)
-        end_width_layout.addWidget(end_width_label)
         self.end_width_spinbox = QDoubleSpinBox()
         self.end_width_spinbox.setRange(0.0, 100.0)
         self.end_width_spinbox.setDecimals(3)
         self.end_width_spinbox.setValue(0.0)
         self.end_width_spinbox.setMinimumWidth(100)
         self.end_width_spinbox.valueChanged.connect(self._emit_changed)  # type: ignore[attr-defined]
-        end_width_layout.addWidget(self.end_width_spinbox)
-        end_width_layout.addStretch()
-        self.layout().addLayout(end_width_layout)
+        layout.addRow("End Label Width (both ends, mm):", self.end_width_spinbox)
 
         # End label text control
-        end_text_layout = QHBoxLayout()
-        end_text_layout.setSpacing(8)
-        end_text_label = QLabel("End Label Text (both ends):")
-        end_text_label.setMinimumWidth(180)
-        end_text_layout.addWidget(end_text_label)
         self.end_text_input = QLineEdit()
         self.end_text_input.setPlaceholderText("Enter text for both end labels")
         self.end_text_input.textChanged.connect(self._emit_changed)  # type: ignore[attr-defined]
-        end_text_layout.addWidget(self.end_text_input)
-        self.layout().addLayout(end_text_layout)
+        layout.addRow("End Label Text (both ends):", self.end_text_input)
 
         # Strip height control
-        height_layout = QHBoxLayout()
-        height_layout.setSpacing(8)
-        height_label = QLabel("Strip Height (mm):")
-        height_label.setMinimumWidth(180)
-        height_layout.addWidget(height_label)
         self.height_spinbox = QDoubleSpinBox()
         self.height_spinbox.setRange(LabelStrip.MIN_HEIGHT, LabelStrip.MAX_HEIGHT)
         self.height_spinbox.setDecimals(1)
         self.height_spinbox.setValue(5.0)
         self.height_spinbox.setMinimumWidth(100)
         self.height_spinbox.valueChanged.connect(self._emit_changed)  # type: ignore[attr-defined]
-        height_layout.addWidget(self.height_spinbox)
-        height_layout.addStretch()
-        self.layout().addLayout(height_layout)
+        layout.addRow("Strip Height (mm):", self.height_spinbox)
 
         # Total width display
-        total_width_layout = QHBoxLayout()
-        total_width_layout.setSpacing(8)
-        total_width_label = QLabel("Total Strip Width (mm):")
-        total_width_label.setMinimumWidth(180)
-        total_width_layout.addWidget(total_width_label)
         self.total_width_label = QLabel("0.0")
-        total_width_layout.addWidget(self.total_width_label)
-        total_width_layout.addStretch()
-        self.layout().addLayout(total_width_layout)
+        layout.addRow("Total Strip Width (mm):", self.total_width_label)
+
+        self.setUpdatesEnabled(True)
 
+        # Coalesce editor bursts: typing "12.345" fires valueChanged per
+        # keystroke, and every strip_changed emission rebuilds the strip
+        # downstream. A zero-interval single-shot timer folds a burst into
+        # one emission on the next event-loop pass.
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self.strip_changed)  # type: ignore[attr-defined]
+
+    @pyqtSlot()
     def _emit_changed(self) -> None:
-        """Emit the strip_changed signal."""
-        self.strip_changed.emit()
+        """Schedule a coalesced strip_changed emission."""
+        if not self.signalsBlocked():
+            self._coalesce_timer.start()
+
+    def flush(self) -> None:
+        """Emit a pending coalesced strip_changed immediately."""
+        if self._coalesce_timer.isActive():
+            self._coalesce_timer.stop()
+            self.strip_changed.emit()
 
     def get_values(self) -> dict[str, int | float | str]:
         """Get the control values as a dictionary."""
@@ -146,27 +238,59 @@ class StripControlPanel(QGroupBox):
         }
 
     def set_values(self, values: dict[str, int | float | str]) -> None:
-        """Set the control values from a dictionary."""
+        """Set the control values from a dictionary.
+
+        The five widget setters run with this panel's signals blocked and
+        a single strip_changed is scheduled at the end -- and only when a
+        value actually changed -- so callers see one atomic change instead
+        of a burst of partial states.
+        """
+        prev_signals = self.blockSignals(True)
+        try:
+            changed = self._set_values(values)
+        finally:
+            self.blockSignals(prev_signals)
+        if changed:
+            self._emit_changed()
+
+    def _set_values(self, values: dict[str, int | float | str]) -> bool:
+        """Write the control values into the widgets (no signal handling).
+
+        Returns:
+            True if any widget's value actually changed
+        """
+        changed = False
         content_cells = values.get("content_cells", 0)
         if not isinstance(content_cells, int):
             raise TypeError(f"Expected int for content_cells, got {type(content_cells).__name__}")
-        self.content_cells_spinbox.setValue(content_cells)
+        if self.content_cells_spinbox.value() != content_cells:
+            self.content_cells_spinbox.setValue(content_cells)
+            changed = True
         cell_width = values.get("cell_width", 10.0)
         if not isinstance(cell_width, int | float):
             raise TypeError(f"Expected int or float for cell_width, got {type(cell_width).__name__}")
-        self.cell_width_spinbox.setValue(float(cell_width))
+        if self.cell_width_spinbox.value() != float(cell_width):
+            self.cell_width_spinbox.setValue(float(cell_width))
+            changed = True
         end_width = values.get("end_width", 0.0)
         if not isinstance(end_width, int | float):
             raise TypeError(f"Expected int or float for end_width, got {type(end_width).__name__}")
-        self.end_width_spinbox.setValue(float(end_width))
+        if self.end_width_spinbox.value() != float(end_width):
+            self.end_width_spinbox.setValue(float(end_width))
+            changed = True
         end_text = values.get("end_text", "")
         if not isinstance(end_text, str):
             raise TypeError(f"Expected str for end_text, got {type(end_text).__name__}")
-        self.end_text_input.setText(end_text)
+        if self.end_text_input.text() != end_text:
+            self.end_text_input.setText(end_text)
+            changed = True
         height = values.get("height", 5.0)
         if not isinstance(height, int | float):
             raise TypeError(f"Expected int or float for height, got {type(height).__name__}")
-        self.height_spinbox.setValue(float(height))
+        if self.height_spinbox.value() != float(height):
+            self.height_spinbox.setValue(float(height))
+            changed = True
+        return changed
 
     def update_total_width(self, width: float) -> None:
         """Update the total width display."""
@@ -216,26 +340,152 @@ class SegmentTable(QTableWidget):
         self.setColumnWidth(self.BG_COLOR_COL, 100)
         self.setColumnWidth(self.WIDTH_COL, 100)
 
+        # Enum columns are plain items edited through shared delegates; the
+        # combobox editor only exists while a cell is being edited.
+        format_model, color_model = _shared_combo_models()
+        self._format_delegate = EnumComboDelegate(format_model, _FORMAT_ROWS, self)
+        self._color_delegate = EnumComboDelegate(color_model, _COLOR_ROWS, self)
+        self.setItemDelegateForColumn(self.FORMAT_COL, self._format_delegate)
+        self.setItemDelegateForColumn(self.TEXT_COLOR_COL, self._color_delegate)
+        self.setItemDelegateForColumn(self.BG_COLOR_COL, self._color_delegate)
+
         # Connect signals
         self.itemChanged.connect(self._on_cell_changed)  # type: ignore[attr-defined]
 
         # Set row height
         self.verticalHeader().setDefaultSectionSize(40)
 
+        # Coalesce per-cell edit bursts into one emission per event-loop
+        # pass, mirroring the control panel's timer.
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self.segment_changed)  # type: ignore[attr-defined]
+
+        # Per-row (text, format, text color, bg color, width) references,
+        # kept in step with the populated rows so reading a row back needs
+        # no item()/cellWidget() calls into the table.
+        self._row_refs: list[
+            tuple[QTableWidgetItem, QTableWidgetItem, QTableWidgetItem, QTableWidgetItem, QDoubleSpinBox]
+        ] = []
+
+        # Rows edited since the last take_dirty_rows() call; None means
+        # "everything may have changed" (bulk rebuilds). Lets the strip
+        # update touch only the affected rows instead of every segment.
+        self._dirty_rows: set[int] | None = None
+
+    @pyqtSlot(QTableWidgetItem)
     def _on_cell_changed(self, item: QTableWidgetItem) -> None:
         """Handle cell content changes."""
-        if item.column() == self.TEXT_COL:
+        if item.column() != self.ID_COL:
+            if self._dirty_rows is not None:
+                self._dirty_rows.add(item.row())
+            self._coalesce_timer.start()
+
+    @pyqtSlot(float)
+    def _emit_segment_changed(self, _value: float) -> None:
+        """Schedule a coalesced segment_changed for a width spinbox change.
+
+        One bound method shared by every row's spinbox; the per-row lambda
+        closures it replaces each cost an allocation and kept their row's
+        widgets alive through the connection. The signalsBlocked guard
+        keeps bulk-population suppression working even though the emission
+        itself is deferred.
+        """
+        if not self.signalsBlocked():
+            if self._dirty_rows is not None:
+                sender = self.sender()
+                row = sender.property("segment_row") if sender is not None else None
+                if isinstance(row, int):
+                    self._dirty_rows.add(row)
+                else:
+                    self._dirty_rows = None
+            self._coalesce_timer.start()
+
+    def take_dirty_rows(self) -> set[int] | None:
+        """Return and reset the rows edited since the last call.
+
+        Returns:
+            The edited row indices, or None if anything beyond tracked
+            per-row edits happened (callers must do a full refresh)
+        """
+        dirty = self._dirty_rows
+        self._dirty_rows = set()
+        return dirty
+
+    def flush(self) -> None:
+        """Emit a pending coalesced segment_changed immediately."""
+        if self._coalesce_timer.isActive():
+            self._coalesce_timer.stop()
             self.segment_changed.emit()
 
     def clear_segments(self) -> None:
         """Clear all segments from the table."""
         self.setRowCount(0)
+        self._row_refs.clear()
 
     def add_segment(self, segment_id: str, text: str = "") -> None:
         """Add a new segment to the table."""
         row = self.rowCount()
         self.insertRow(row)
+        self._populate_row(row, segment_id, text)
+
+    def add_segments_bulk(self, items: list[tuple[str, str]]) -> None:
+        """
+        Replace the table contents with the given segments in one pass.
+
+        Repaints and signal emissions are suppressed while the rows are
+        built, so populating a large strip costs one layout/update instead
+        of several widget events per row; a single segment_changed is
+        emitted at the end. Rows that already exist keep their editor
+        widgets (reset to defaults) -- creating five widgets per row is
+        the dominant cost of a rebuild, and reloads mostly shift the row
+        count by a handful.
+
+        Args:
+            items: (segment_id, text) pairs in display order
+        """
+        prev_signals = self.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        try:
+            reusable = self.rowCount()
+            self.setRowCount(len(items))
+            # Rows dropped by the shrink were deleted by Qt; forget them.
+            del self._row_refs[len(items) :]
+            for row, (segment_id, text) in enumerate(items):
+                if row < reusable and self.cellWidget(row, self.WIDTH_COL) is not None:
+                    self._reuse_row(row, segment_id, text)
+                else:
+                    self._populate_row(row, segment_id, text)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.blockSignals(prev_signals)
+        # A rebuild can change any row; per-row tracking restarts after
+        # the listener has refreshed.
+        self._dirty_rows = None
+        self.segment_changed.emit()
+
+    def update_row_text(self, row: int, text: str) -> None:
+        """Set one row's text item in place without firing change signals."""
+        item = self.item(row, self.TEXT_COL)
+        if item is None:
+            return
+        prev_signals = self.blockSignals(True)
+        item.setText(text)
+        self.blockSignals(prev_signals)
+
+    def _reuse_row(self, row: int, segment_id: str, text: str) -> None:
+        """Refresh an existing row's items and reset its editors to defaults."""
+        self.item(row, self.ID_COL).setText(segment_id)
+        self.item(row, self.TEXT_COL).setText(text)
+        self._write_enum_item(row, self.FORMAT_COL, _FORMAT_LABELS[TextFormat.NORMAL], TextFormat.NORMAL)
+        self._write_enum_item(row, self.TEXT_COLOR_COL, _COLOR_LABELS[StandardColor.BLACK], StandardColor.BLACK)
+        self._write_enum_item(row, self.BG_COLOR_COL, _COLOR_LABELS[StandardColor.WHITE], StandardColor.WHITE)
+        width_spinbox = self.cellWidget(row, self.WIDTH_COL)
+        width_spinbox.setProperty("segment_row", row)
+        width_spinbox.setValue(10.0)
 
+    def _populate_row(self, row: int, segment_id: str, text: str) -> None:
+        """Fill one table row with its item and editor widgets."""
         # Set ID (non-editable)
         id_item = QTableWidgetItem(segment_id)
         id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
@@ -245,123 +495,155 @@ class SegmentTable(QTableWidget):
         text_item = QTableWidgetItem(text)
         self.setItem(row, self.TEXT_COL, text_item)
 
-        # Create format combobox
-        format_combo = QComboBox()
-        for fmt in TextFormat:
-            format_combo.addItem(str(fmt), fmt)
-        format_combo.currentIndexChanged.connect(lambda: self.segment_changed.emit())  # type: ignore[attr-defined]
-        self.setCellWidget(row, self.FORMAT_COL, format_combo)
-
-        # Create text color combobox
-        text_color_combo = QComboBox()
-        for color in StandardColor:
-            text_color_combo.addItem(color.name.title(), color)
-        text_color_combo.currentIndexChanged.connect(  # type: ignore[attr-defined]
-            lambda: self.segment_changed.emit()
-        )
-        self.setCellWidget(row, self.TEXT_COLOR_COL, text_color_combo)
-
-        # Create background color combobox
-        bg_color_combo = QComboBox()
-        for color in StandardColor:
-            bg_color_combo.addItem(color.name.title(), color)
-        bg_color_combo.currentIndexChanged.connect(lambda: self.segment_changed.emit())  # type: ignore[attr-defined]
-        self.setCellWidget(row, self.BG_COLOR_COL, bg_color_combo)
+        # Enum cells: delegate-edited items with default values
+        self._write_enum_item(row, self.FORMAT_COL, _FORMAT_LABELS[TextFormat.NORMAL], TextFormat.NORMAL)
+        self._write_enum_item(row, self.TEXT_COLOR_COL, _COLOR_LABELS[StandardColor.BLACK], StandardColor.BLACK)
+        self._write_enum_item(row, self.BG_COLOR_COL, _COLOR_LABELS[StandardColor.WHITE], StandardColor.WHITE)
 
         # Create width spinbox
         width_spinbox = QDoubleSpinBox()
         width_spinbox.setRange(0.001, 100.0)
         width_spinbox.setDecimals(3)
         width_spinbox.setValue(10.0)
-        width_spinbox.valueChanged.connect(lambda: self.segment_changed.emit())  # type: ignore[attr-defined]
+        # Rows never move without a rebuild, so the editor can carry its
+        # row for dirty tracking.
+        width_spinbox.setProperty("segment_row", row)
+        width_spinbox.valueChanged.connect(self._emit_segment_changed)  # type: ignore[attr-defined]
         self.setCellWidget(row, self.WIDTH_COL, width_spinbox)
 
-        # Set default colors based on settings
-        # Default text color to black
-        text_color_combo.setCurrentText("Black")
-        # Set default background color to white
-        bg_color_combo.setCurrentText("White")
+        self._register_row_refs(row)
+
+    def _register_row_refs(self, row: int) -> None:
+        """Record a freshly populated row's items and editor for direct reads."""
+        refs = (
+            self.item(row, self.TEXT_COL),
+            self.item(row, self.FORMAT_COL),
+            self.item(row, self.TEXT_COLOR_COL),
+            self.item(row, self.BG_COLOR_COL),
+            self.cellWidget(row, self.WIDTH_COL),
+        )
+        if row == len(self._row_refs):
+            self._row_refs.append(refs)
+        else:
+            self._row_refs[row] = refs
+
+    def _write_enum_item(self, row: int, col: int, label: str, value: object) -> None:
+        """Set an enum cell's label and user-role value, reusing the item if present."""
+        item = self.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, value)
+            self.setItem(row, col, item)
+        else:
+            item.setText(label)
+            item.setData(Qt.ItemDataRole.UserRole, value)
 
     def get_segment_data(self, row: int) -> dict[str, str | TextFormat | StandardColor | float] | None:
         """Get the data for a segment row."""
-        # Get widgets and values
-        text_item = self.item(row, self.TEXT_COL)
-        format_combo = self.cellWidget(row, self.FORMAT_COL)
-        text_color_combo = self.cellWidget(row, self.TEXT_COLOR_COL)
-        bg_color_combo = self.cellWidget(row, self.BG_COLOR_COL)
-        width_spinbox = self.cellWidget(row, self.WIDTH_COL)
+        if 0 <= row < len(self._row_refs):
+            # Registered rows read from the cached references: one list
+            # index instead of five item()/cellWidget() round-trips.
+            text_item, format_item, text_color_item, bg_color_item, width_spinbox = self._row_refs[row]
+        else:
+            text_item = self.item(row, self.TEXT_COL)
+            format_item = self.item(row, self.FORMAT_COL)
+            text_color_item = self.item(row, self.TEXT_COLOR_COL)
+            bg_color_item = self.item(row, self.BG_COLOR_COL)
+            width_spinbox = self.cellWidget(row, self.WIDTH_COL)
 
         if (
             text_item is None
-            or format_combo is None
-            or text_color_combo is None
-            or bg_color_combo is None
+            or format_item is None
+            or text_color_item is None
+            or bg_color_item is None
             or width_spinbox is None
         ):
             return None
 
-        text = text_item.text()
-        text_format = format_combo.currentData()
-        text_color = text_color_combo.currentData()
-        bg_color = bg_color_combo.currentData()
-        width = width_spinbox.value()
-
         return {
-            "text": text,
-            "text_format": text_format,
-            "text_color": text_color,
-            "bg_color": bg_color,
-            "width": width,
+            "text": text_item.text(),
+            "text_format": format_item.data(Qt.ItemDataRole.UserRole),
+            "text_color": text_color_item.data(Qt.ItemDataRole.UserRole),
+            "bg_color": bg_color_item.data(Qt.ItemDataRole.UserRole),
+            "width": width_spinbox.value(),
         }
 
+    def snapshot_rows(self) -> list[dict[str, str | TextFormat | StandardColor | float] | None]:
+        """Read every row's data in one pass, top to bottom."""
+        return [self.get_segment_data(row) for row in range(self.rowCount())]
+
     def set_segment_data(self, row: int, data: dict[str, str | TextFormat | StandardColor | float]) -> None:
         """Set the data for a segment row."""
-        # Set text
+        # Set text (reusing the existing item, like the enum cells, so a
+        # project load allocates no new items for rows that already exist)
         text = data.get("text", "")
         if not isinstance(text, str):
             raise TypeError(f"Expected str for text, got {type(text).__name__}")
-        text_item = QTableWidgetItem(text)
-        self.setItem(row, self.TEXT_COL, text_item)
+        text_item = self.item(row, self.TEXT_COL)
+        if text_item is None:
+            self.setItem(row, self.TEXT_COL, QTableWidgetItem(text))
+        else:
+            text_item.setText(text)
 
         # Set format
-        format_combo = self.cellWidget(row, self.FORMAT_COL)
         text_format = data.get("text_format", TextFormat.NORMAL)
-        for i in range(format_combo.count()):
-            if format_combo.itemData(i) == text_format:
-                format_combo.setCurrentIndex(i)
-                break
+        if not isinstance(text_format, TextFormat):
+            text_format = TextFormat.NORMAL
+        self._write_enum_item(row, self.FORMAT_COL, _FORMAT_LABELS[text_format], text_format)
 
         # Set text color
-        text_color_combo = self.cellWidget(row, self.TEXT_COLOR_COL)
         text_color = data.get("text_color", StandardColor.BLACK)
-        for i in range(text_color_combo.count()):
-            if text_color_combo.itemData(i) == text_color:
-                text_color_combo.setCurrentIndex(i)
-                break
+        if not isinstance(text_color, StandardColor):
+            text_color = StandardColor.BLACK
+        self._write_enum_item(row, self.TEXT_COLOR_COL, _COLOR_LABELS[text_color], text_color)
 
         # Set background color
-        bg_color_combo = self.cellWidget(row, self.BG_COLOR_COL)
         bg_color = data.get("bg_color", StandardColor.WHITE)
-        for i in range(bg_color_combo.count()):
-            if bg_color_combo.itemData(i) == bg_color:
-                bg_color_combo.setCurrentIndex(i)
-                break
+        if not isinstance(bg_color, StandardColor):
+            bg_color = StandardColor.WHITE
+        self._write_enum_item(row, self.BG_COLOR_COL, _COLOR_LABELS[bg_color], bg_color)
 
-        # Set width
+        # Set width (skip the setter when the value is already current)
         width_spinbox = self.cellWidget(row, self.WIDTH_COL)
         width = data.get("width", 10.0)
-        width_spinbox.setValue(width)
+        if width_spinbox.value() != width:
+            width_spinbox.setValue(width)
 
 
 class DesignerTab(QWidget):
     """Tab for designing label strips."""
 
+    # Emitted after self.strip has been synced from a UI edit (or a load).
+    # The widget-level strip_changed/segment_changed signals fire before
+    # the deferred sync runs, so external listeners that read the strip
+    # (preview, modified tracking) must connect here instead.
+    strip_updated = pyqtSignal()
+
     def __init__(self, parent: QWidgetType | None = None) -> None:
         """Initialize the designer tab."""
         super().__init__(parent)
 
-        # Track current project path for export filenames
+        # Track current project path for export filenames; the basename is
+        # derived lazily and invalidated when the path changes.
         self._current_project_path: str | None = None
+        self._cached_project_basename: str | None = None
+
+        # In-flight background I/O tasks; each reference keeps its task
+        # alive until the finished signal fires, and doubles as a guard
+        # against starting the same operation twice.
+        self._pdf_export_task: StripPdfExportTask | None = None
+        self._png_export_task: StripPngExportTask | None = None
+        self._project_save_task: ProjectSaveTask | None = None
+        self._project_load_task: ProjectLoadTask | None = None
+
+        # Control values as of the last controls-driven update, used to
+        # decide whether a table rebuild is actually needed.
+        self._last_control_values: dict[str, int | float | str] | None = None
+
+        # Total width shown in the panel, keyed on the geometry-affecting
+        # control values; lets height/text keystrokes skip the width re-sum.
+        self._last_geom_key: tuple[int | float | str, ...] | None = None
+        self._last_total_width: float | None = None
 
         # Create main layout with improved spacing
         main_layout = QVBoxLayout(self)
@@ -440,9 +722,18 @@ class DesignerTab(QWidget):
         # Initialize strip
         self.strip = LabelStrip()
 
+        # Pending flags for coalescing bursts of edit signals (a single
+        # keystroke can fire several valueChanged/cellChanged emissions).
+        self._controls_update_pending = False
+        self._table_update_pending = False
+
+        # Re-entrancy guard for table rebuilds: cheaper than disconnecting
+        # and reconnecting segment_changed around every rebuild.
+        self._updating_table = False
+
         # Connect signals
-        self.control_panel.strip_changed.connect(self.update_strip_from_controls)
-        self.segment_table.segment_changed.connect(self.update_strip_from_table)
+        self.control_panel.strip_changed.connect(self._schedule_controls_update)
+        self.segment_table.segment_changed.connect(self._schedule_table_update)
 
         # Initialize UI
         self.reset_ui()
@@ -452,31 +743,55 @@ class DesignerTab(QWidget):
         # Create a new empty strip
         self.strip = LabelStrip()
 
-        # Set control panel values
-        self.control_panel.set_values({
+        values: dict[str, int | float | str] = {
             "content_cells": 0,
             "cell_width": self.strip.content_cell_width,
             "end_width": 0.0,
             "end_text": "",
             "height": self.strip.height,
-        })
+        }
+
+        # Set control panel values with signals blocked, exactly like
+        # load_label_strip: a coalesced strip_changed would run its
+        # deferred update after the caller has already cleared its
+        # modified flag, marking a brand-new project as modified.
+        panel = self.control_panel
+        prev_signals = panel.blockSignals(True)
+        try:
+            panel.set_values(values)
+        finally:
+            panel.blockSignals(prev_signals)
+
+        # The controls now mirror the strip; seed the caches so the next
+        # controls-driven update sees no spurious deltas.
+        self._last_control_values = values
 
         # Clear the segment table
         self.segment_table.clear_segments()
 
-        # Update total width display
-        self.control_panel.update_total_width(self.strip.get_total_width())
+        # Update total width display (and the geometry-keyed cache)
+        total_width = self.strip.get_total_width()
+        self._last_geom_key = (values["content_cells"], values["cell_width"], values["end_width"])
+        self._last_total_width = total_width
+        panel.update_total_width(total_width)
+
+        # One synchronous notification in place of the suppressed
+        # coalesced emissions; the strip is fully synced at this point.
+        self.strip_updated.emit()
 
     def set_project_path(self, project_path: str | None) -> None:
         """Set the current project path for export filename generation."""
         self._current_project_path = project_path
+        self._cached_project_basename = None
 
     def _get_default_export_filename(self, extension: str) -> str:
         """Generate default export filename based on current project name."""
         if self._current_project_path:
-            # Extract project name without extension
-            project_name = os.path.splitext(os.path.basename(self._current_project_path))[0]
-            return f"{project_name}.{extension}"
+            # Extract project name without extension (computed once per
+            # project path; every export dialog reuses it)
+            if self._cached_project_basename is None:
+                self._cached_project_basename = os.path.splitext(os.path.basename(self._current_project_path))[0]
+            return f"{self._cached_project_basename}.{extension}"
         # Fallback for unsaved projects
         return f"label_strip.{extension}"
 
@@ -489,34 +804,109 @@ class DesignerTab(QWidget):
         end_text = self.strip.end_segment.text if self.strip.end_segment else ""
         content_cells = len(self.strip.content_segments)
 
-        # Set control panel values
-        self.control_panel.set_values({
+        values: dict[str, int | float | str] = {
             "content_cells": content_cells,
             "cell_width": self.strip.content_cell_width,
             "end_width": end_width,
             "end_text": end_text,
             "height": self.strip.height,
-        })
+        }
+
+        # Set control panel values with signals blocked: each setValue
+        # would otherwise queue a strip_changed, and the deferred
+        # update_strip_from_controls pass would rebuild the table a second
+        # time right after the explicit rebuild below.
+        panel = self.control_panel
+        prev_signals = panel.blockSignals(True)
+        try:
+            panel.set_values(values)
+        finally:
+            panel.blockSignals(prev_signals)
+
+        # The controls now mirror the strip; seed the caches so the next
+        # controls-driven update sees no spurious deltas.
+        self._last_control_values = values
 
         # Update the table to match the loaded strip
         self.update_table_from_strip()
 
-        # Update total width display
-        self.control_panel.update_total_width(self.strip.get_total_width())
+        # Update total width display (and the geometry-keyed cache)
+        total_width = self.strip.get_total_width()
+        self._last_geom_key = (values["content_cells"], values["cell_width"], values["end_width"])
+        self._last_total_width = total_width
+        panel.update_total_width(total_width)
+
+        # One synchronous notification for listeners (preview, modified
+        # flag) in place of the coalesced emissions suppressed above; the
+        # strip is fully synced at this point.
+        self.strip_updated.emit()
+
+    @pyqtSlot()
+    def _schedule_controls_update(self) -> None:
+        """Coalesce control-panel edits into one deferred model/UI refresh."""
+        if not self._controls_update_pending:
+            self._controls_update_pending = True
+            QTimer.singleShot(0, self._flush_controls_update)
+
+    def _flush_controls_update(self) -> None:
+        """Run the deferred control-panel update, if one is pending."""
+        if not self._controls_update_pending:
+            return
+        self._controls_update_pending = False
+        self.update_strip_from_controls()
+        self.strip_updated.emit()
+
+    def flush_pending_edits(self) -> None:
+        """Apply coalesced-but-deferred edits to the strip immediately.
+
+        Save and export snapshot self.strip; an edit made just before the
+        click may still be sitting in a widget's coalescing timer or in a
+        scheduled update, so both stages are drained synchronously first.
+        Callers outside this tab (the main window's save/export actions)
+        must call this before reading self.strip.
+        """
+        self.control_panel.flush()
+        self.segment_table.flush()
+        if self._controls_update_pending:
+            self._flush_controls_update()
+        if self._table_update_pending:
+            self._flush_table_update()
+
+    @pyqtSlot()
+    def _schedule_table_update(self) -> None:
+        """Coalesce segment-table edits into one deferred model refresh."""
+        if not self._table_update_pending:
+            self._table_update_pending = True
+            QTimer.singleShot(0, self._flush_table_update)
+
+    def _flush_table_update(self) -> None:
+        """Run the deferred segment-table update, if one is pending."""
+        if not self._table_update_pending:
+            return
+        self._table_update_pending = False
+        self.update_strip_from_table()
+        self.strip_updated.emit()
 
     def update_strip_from_controls(self) -> None:
         """Update the strip model from control panel values."""
         values = self.control_panel.get_values()
+        prev_values = self._last_control_values
+        self._last_control_values = values
 
-        # Update strip properties
+        # Update strip properties. Each mutation is guarded against its
+        # current value: the setters invalidate the strip's width cache (and
+        # content_cell_width rewrites every segment), so a no-change call
+        # still costs an O(N) recompute downstream.
         height = values["height"]
         if not isinstance(height, int | float):
             raise TypeError(f"Expected int or float for height, got {type(height).__name__}")
-        self.strip.height = float(height)
+        if self.strip.height != float(height):
+            self.strip.height = float(height)
         cell_width = values["cell_width"]
         if not isinstance(cell_width, int | float):
             raise TypeError(f"Expected int or float for cell_width, got {type(cell_width).__name__}")
-        self.strip.content_cell_width = float(cell_width)
+        if self.strip.content_cell_width != float(cell_width):
+            self.strip.content_cell_width = float(cell_width)
 
         # Update end segment
         end_width = values["end_width"]
@@ -524,23 +914,19 @@ class DesignerTab(QWidget):
             raise TypeError(f"Expected int or float for end_width, got {type(end_width).__name__}")
         if float(end_width) > 0:
             # Set both end and start segments with the same properties
-            self.strip.set_end_segment(width=float(end_width))
-            self.strip.set_start_segment(width=float(end_width))
-
-            # Set the end segment text from the control panel
-            if self.strip.end_segment:
-                end_text = values["end_text"]
-                if not isinstance(end_text, str):
-                    raise TypeError(f"Expected str for end_text, got {type(end_text).__name__}")
+            if self.strip.end_segment is None or self.strip.end_segment.width != float(end_width):
+                self.strip.set_end_segment(width=float(end_width))
+                self.strip.set_start_segment(width=float(end_width))
+
+            end_text = values["end_text"]
+            if not isinstance(end_text, str):
+                raise TypeError(f"Expected str for end_text, got {type(end_text).__name__}")
+            # Keep both end labels on the control panel's text
+            if self.strip.end_segment is not None and self.strip.end_segment.text != end_text:
                 self.strip.end_segment.text = end_text
-
-            # Set the start segment text to be the same as the end segment
-            if self.strip.start_segment:
-                end_text = values["end_text"]
-                if not isinstance(end_text, str):
-                    raise TypeError(f"Expected str for end_text, got {type(end_text).__name__}")
+            if self.strip.start_segment is not None and self.strip.start_segment.text != end_text:
                 self.strip.start_segment.text = end_text
-        else:
+        elif self.strip.end_segment is not None or self.strip.start_segment is not None:
             # If no end segment, remove both start and end segments
             self.strip.set_end_segment(width=0)
             self.strip.set_start_segment(width=0)
@@ -549,95 +935,91 @@ class DesignerTab(QWidget):
         content_cells = values["content_cells"]
         if not isinstance(content_cells, int):
             raise TypeError(f"Expected int for content_cells, got {type(content_cells).__name__}")
-        self.strip.set_content_segment_count(content_cells)
-
-        # Update UI
-        self.update_table_from_strip()
-        self.control_panel.update_total_width(self.strip.get_total_width())
+        if content_cells != len(self.strip.content_segments):
+            self.strip.set_content_segment_count(content_cells)
+
+        # Update UI. A rebuild only matters when something the table shows
+        # changed: row structure (counts, end rows) or column values (cell
+        # widths). Height tweaks touch no table cell, and an end-text edit
+        # only needs the two end rows' text items patched in place.
+        structure_changed = (
+            prev_values is None
+            or prev_values["content_cells"] != values["content_cells"]
+            or (float(prev_values["end_width"]) > 0) != (float(end_width) > 0)  # type: ignore[arg-type]
+        )
+        if (
+            structure_changed
+            or prev_values["cell_width"] != values["cell_width"]
+            or prev_values["end_width"] != values["end_width"]
+        ):
+            self.update_table_from_strip()
+        elif prev_values["end_text"] != values["end_text"] and self.strip.end_segment is not None:
+            table = self.segment_table
+            if self.strip.start_segment is not None:
+                table.update_row_text(0, self.strip.end_segment.text)
+            table.update_row_text(table.rowCount() - 1, self.strip.end_segment.text)
+
+        # Only geometry fields can move the total; reuse the displayed value
+        # otherwise (table edits invalidate it separately, since they can
+        # change individual widths).
+        geom_key = (values["content_cells"], values["cell_width"], values["end_width"])
+        if self._last_total_width is None or geom_key != self._last_geom_key:
+            self._last_total_width = self.strip.get_total_width()
+            self._last_geom_key = geom_key
+        self.control_panel.update_total_width(self._last_total_width)
 
     def update_strip_from_table(self) -> None:
         """Update the strip model from segment table values."""
+        if self._updating_table:
+            return  # Rebuild in progress; the table is not user state yet
+
+        # Table edits can change individual segment widths.
+        self._last_total_width = None
+
+        # Fast path: when only tracked content rows changed, apply just
+        # those. Start/end rows keep the full pass because the end row's
+        # values are mirrored onto the start segment.
+        dirty = self.segment_table.take_dirty_rows()
+        content = self.strip.content_segments
+        offset = 1 if self.strip.start_segment is not None else 0
+        expected_rows = offset + len(content) + (1 if self.strip.end_segment is not None else 0)
+        if (
+            dirty
+            and self.segment_table.rowCount() == expected_rows
+            and all(offset <= row < offset + len(content) for row in dirty)
+        ):
+            for row in dirty:
+                data = self.segment_table.get_segment_data(row)
+                if data is not None:
+                    self._apply_row_data(content[row - offset], data)
+            return
+
+        # Snapshot the whole table once, then apply to segments from plain
+        # Python data -- no further widget access inside the loops.
+        rows = self.segment_table.snapshot_rows()
+
         # Start segment
         if self.strip.start_segment is not None:
-            row = 0
-            data = self.segment_table.get_segment_data(row)
-            if data is not None:
-                text = data["text"]
-                if not isinstance(text, str):
-                    raise TypeError(f"Expected str for text, got {type(text).__name__}")
-                self.strip.start_segment.text = text
-                text_format = data["text_format"]
-                if not isinstance(text_format, TextFormat):
-                    raise TypeError(f"Expected TextFormat for text_format, got {type(text_format).__name__}")
-                self.strip.start_segment.text_format = text_format
-                text_color = data["text_color"]
-                if not isinstance(text_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for text_color, got {type(text_color).__name__}")
-                self.strip.start_segment.text_color = Color.from_standard(text_color)
-                bg_color = data["bg_color"]
-                if not isinstance(bg_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for bg_color, got {type(bg_color).__name__}")
-                self.strip.start_segment.background_color = Color.from_standard(bg_color)
-                width = data["width"]
-                if not isinstance(width, int | float):
-                    raise TypeError(f"Expected int or float for width, got {type(width).__name__}")
-                self.strip.start_segment.width = float(width)
-
+            if rows and rows[0] is not None:
+                self._apply_row_data(self.strip.start_segment, rows[0])
             start_row_offset = 1
         else:
             start_row_offset = 0
 
         # Content segments
-        for i, segment in enumerate(self.strip.content_segments):
-            row = start_row_offset + i
-            data = self.segment_table.get_segment_data(row)
+        for segment, data in zip(
+            self.strip.content_segments,
+            rows[start_row_offset : start_row_offset + len(self.strip.content_segments)],
+            strict=False,
+        ):
             if data is not None:
-                text = data["text"]
-                if not isinstance(text, str):
-                    raise TypeError(f"Expected str for text, got {type(text).__name__}")
-                segment.text = text
-                text_format = data["text_format"]
-                if not isinstance(text_format, TextFormat):
-                    raise TypeError(f"Expected TextFormat for text_format, got {type(text_format).__name__}")
-                segment.text_format = text_format
-                text_color = data["text_color"]
-                if not isinstance(text_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for text_color, got {type(text_color).__name__}")
-                segment.text_color = Color.from_standard(text_color)
-                bg_color = data["bg_color"]
-                if not isinstance(bg_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for bg_color, got {type(bg_color).__name__}")
-                segment.background_color = Color.from_standard(bg_color)
-                width = data["width"]
-                if not isinstance(width, int | float):
-                    raise TypeError(f"Expected int or float for width, got {type(width).__name__}")
-                segment.width = float(width)
+                self._apply_row_data(segment, data)
 
         # End segment
         if self.strip.end_segment is not None:
             row = start_row_offset + len(self.strip.content_segments)
-            data = self.segment_table.get_segment_data(row)
-            if data is not None:
-                text = data["text"]
-                if not isinstance(text, str):
-                    raise TypeError(f"Expected str for text, got {type(text).__name__}")
-                self.strip.end_segment.text = text
-                text_format = data["text_format"]
-                if not isinstance(text_format, TextFormat):
-                    raise TypeError(f"Expected TextFormat for text_format, got {type(text_format).__name__}")
-                self.strip.end_segment.text_format = text_format
-                text_color = data["text_color"]
-                if not isinstance(text_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for text_color, got {type(text_color).__name__}")
-                self.strip.end_segment.text_color = Color.from_standard(text_color)
-                bg_color = data["bg_color"]
-                if not isinstance(bg_color, StandardColor):
-                    raise TypeError(f"Expected StandardColor for bg_color, got {type(bg_color).__name__}")
-                self.strip.end_segment.background_color = Color.from_standard(bg_color)
-                width = data["width"]
-                if not isinstance(width, int | float):
-                    raise TypeError(f"Expected int or float for width, got {type(width).__name__}")
-                self.strip.end_segment.width = float(width)
+            if row < len(rows) and rows[row] is not None:
+                self._apply_row_data(self.strip.end_segment, rows[row])  # type: ignore[arg-type]
 
                 # Synchronize start segment with end segment if both exist
                 if self.strip.start_segment is not None:
@@ -646,6 +1028,30 @@ class DesignerTab(QWidget):
                     self.strip.start_segment.text_color = self.strip.end_segment.text_color
                     self.strip.start_segment.background_color = self.strip.end_segment.background_color
 
+    @staticmethod
+    def _apply_row_data(segment: Segment, data: dict[str, str | TextFormat | StandardColor | float]) -> None:
+        """Copy one table row's snapshot onto a segment."""
+        text = data["text"]
+        if not isinstance(text, str):
+            raise TypeError(f"Expected str for text, got {type(text).__name__}")
+        segment.text = text
+        text_format = data["text_format"]
+        if not isinstance(text_format, TextFormat):
+            raise TypeError(f"Expected TextFormat for text_format, got {type(text_format).__name__}")
+        segment.text_format = text_format
+        text_color = data["text_color"]
+        if not isinstance(text_color, StandardColor):
+            raise TypeError(f"Expected StandardColor for text_color, got {type(text_color).__name__}")
+        segment.text_color = Color.from_standard(text_color)
+        bg_color = data["bg_color"]
+        if not isinstance(bg_color, StandardColor):
+            raise TypeError(f"Expected StandardColor for bg_color, got {type(bg_color).__name__}")
+        segment.background_color = Color.from_standard(bg_color)
+        width = data["width"]
+        if not isinstance(width, int | float):
+            raise TypeError(f"Expected int or float for width, got {type(width).__name__}")
+        segment.width = float(width)
+
     @staticmethod
     def _segment_to_table_data(segment: Segment) -> dict[str, str | TextFormat | StandardColor | float]:
         """Convert a Segment into a dict suitable for SegmentTable.set_segment_data()."""
@@ -661,72 +1067,63 @@ class DesignerTab(QWidget):
 
     def update_table_from_strip(self) -> None:
         """Update the segment table to match the strip model."""
-        self.segment_table.segment_changed.disconnect(self.update_strip_from_table)
-
+        table = self.segment_table
+        self._updating_table = True
+        prev_signals = table.blockSignals(True)
+        table.setUpdatesEnabled(False)
         try:
-            self.segment_table.clear_segments()
-
-            row = 0
+            # Collect the rows first, then populate in one bulk pass.
+            row_segments: list[Segment] = []
+            items: list[tuple[str, str]] = []
             if self.strip.start_segment is not None:
-                self.segment_table.add_segment("L Start", self.strip.start_segment.text)
-                self.segment_table.set_segment_data(row, self._segment_to_table_data(self.strip.start_segment))
-                row += 1
-
+                items.append(("L Start", self.strip.start_segment.text))
+                row_segments.append(self.strip.start_segment)
             for segment in self.strip.content_segments:
-                self.segment_table.add_segment(segment.id, segment.text)
-                self.segment_table.set_segment_data(row, self._segment_to_table_data(segment))
-                row += 1
-
+                items.append((segment.id, segment.text))
+                row_segments.append(segment)
             if self.strip.end_segment is not None:
-                self.segment_table.add_segment("L End", self.strip.end_segment.text)
-                self.segment_table.set_segment_data(row, self._segment_to_table_data(self.strip.end_segment))
+                items.append(("L End", self.strip.end_segment.text))
+                row_segments.append(self.strip.end_segment)
+
+            table.add_segments_bulk(items)
+            for row, segment in enumerate(row_segments):
+                table.set_segment_data(row, self._segment_to_table_data(segment))
         finally:
-            self.segment_table.segment_changed.connect(self.update_strip_from_table)
+            table.setUpdatesEnabled(True)
+            table.blockSignals(prev_signals)
+            self._updating_table = False
+            # Table and strip are in sync now; restart per-row tracking.
+            table.take_dirty_rows()
 
+    @pyqtSlot()
     def _add_row(self) -> None:
         """Add a new content segment to the strip."""
-        # Get current content cell count
-        current_count = len(self.strip.content_segments)
-
-        # Add one more content segment
-        self.strip.set_content_segment_count(current_count + 1)
-
-        # Update the control panel to reflect the new count
-        values = self.control_panel.get_values()
-        values["content_cells"] = current_count + 1
-        self.control_panel.set_values(values)
-
-        # Update the table to show the new segment
-        self.update_table_from_strip()
-
-        # Update total width display
-        self.control_panel.update_total_width(self.strip.get_total_width())
+        # Route through the content-cells spinbox: its valueChanged feeds
+        # the coalescing pipeline, so the model update, table rebuild, and
+        # width refresh all run exactly once on the next event-loop pass
+        # (mutating the strip and rebuilding here as well did each twice).
+        self.control_panel.content_cells_spinbox.setValue(len(self.strip.content_segments) + 1)
 
+    @pyqtSlot()
     def _remove_row(self) -> None:
         """Remove the last content segment from the strip."""
-        # Get current content cell count
         current_count = len(self.strip.content_segments)
 
         # Don't allow removing if there are no content segments
         if current_count <= 0:
             return
 
-        # Remove one content segment
-        self.strip.set_content_segment_count(current_count - 1)
-
-        # Update the control panel to reflect the new count
-        values = self.control_panel.get_values()
-        values["content_cells"] = current_count - 1
-        self.control_panel.set_values(values)
-
-        # Update the table to show the removed segment
-        self.update_table_from_strip()
-
-        # Update total width display
-        self.control_panel.update_total_width(self.strip.get_total_width())
+        # Same single coalesced update path as _add_row.
+        self.control_panel.content_cells_spinbox.setValue(current_count - 1)
 
+    @pyqtSlot()
     def save_project(self) -> None:
         """Save the current project."""
+        if self._project_save_task is not None:
+            return  # A save is already running
+
+        self.flush_pending_edits()
+
         # Get file path to save to
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Project", "untitled.jlp", ProjectManager.PROJECT_FILTER)
 
@@ -735,23 +1132,39 @@ class DesignerTab(QWidget):
 
         # Save the project
         try:
-            success = ProjectManager.save_project(self.strip, file_path)
-
-            if success:
-                QMessageBox.information(self, "Project Saved", f"Project has been saved to:\n{file_path}")
-            else:
-                QMessageBox.critical(self, "Save Error", f"Failed to save project to:\n{file_path}")
+            # Serialize and write on a thread-pool worker so disk I/O never
+            # stalls the event loop. The task snapshots the strip, so
+            # further edits are safe while it runs.
+            task = ProjectSaveTask(self.strip, file_path)
+            task.signals.finished.connect(self._on_project_saved)
+            # Keep the task alive until its finished signal fires.
+            self._project_save_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
+            self._project_save_task = None
             QMessageBox.critical(
                 self,
                 "Save Error",
                 f"An unexpected error occurred while saving the project:\n{e!s}",
             )
 
+    @pyqtSlot(bool, str)
+    def _on_project_saved(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background project save."""
+        self._project_save_task = None
+        if success:
+            QMessageBox.information(self, "Project Saved", f"Project has been saved to:\n{file_path}")
+        else:
+            QMessageBox.critical(self, "Save Error", f"Failed to save project to:\n{file_path}")
+
+    @pyqtSlot()
     def load_project(self) -> None:
         """Load a project from file."""
+        if self._project_load_task is not None:
+            return  # A load is already running
+
         # Get file path to load from
         file_path, _ = QFileDialog.getOpenFileName(self, "Load Project", "", ProjectManager.PROJECT_FILTER)
 
@@ -760,31 +1173,46 @@ class DesignerTab(QWidget):
 
         # Load the project
         try:
-            label_strip = ProjectManager.load_project(file_path)
-            if label_strip is None:
-                QMessageBox.critical(
-                    self,
-                    "Load Error",
-                    f"Failed to load project from:\n{file_path}\n\n"
-                    "The file may be corrupted or in an unsupported format.",
-                )
-                return
-
-            # Load the label strip into the UI
-            self.load_label_strip(label_strip)
-
-            QMessageBox.information(self, "Project Loaded", f"Project has been loaded from:\n{file_path}")
+            # Read and parse on a thread-pool worker; the constructed strip
+            # arrives through the finished signal.
+            task = ProjectLoadTask(file_path)
+            task.signals.finished.connect(self._on_project_loaded)
+            # Keep the task alive until its finished signal fires.
+            self._project_load_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
+            self._project_load_task = None
             QMessageBox.critical(
                 self,
                 "Load Error",
                 f"An unexpected error occurred while loading the project:\n{e!s}",
             )
 
+    @pyqtSlot(object, str)
+    def _on_project_loaded(self, label_strip: object, file_path: str) -> None:
+        """Apply the result of a background project load to the UI."""
+        self._project_load_task = None
+        if not isinstance(label_strip, LabelStrip):
+            QMessageBox.critical(
+                self,
+                "Load Error",
+                f"Failed to load project from:\n{file_path}\n\n"
+                "The file may be corrupted or in an unsupported format.",
+            )
+            return
+
+        # Load the label strip into the UI
+        self.load_label_strip(label_strip)
+
+        QMessageBox.information(self, "Project Loaded", f"Project has been loaded from:\n{file_path}")
+
+    @pyqtSlot()
     def generate_pdf(self) -> None:
         """Generate a PDF of the current label strip."""
+        self.flush_pending_edits()
+
         # Check if there are any segments to generate
         if self.strip.get_total_width() == 0:
             QMessageBox.warning(
@@ -804,27 +1232,40 @@ class DesignerTab(QWidget):
             return  # User cancelled
 
         try:
-            # Create PDF generator
-            pdf_generator = PDFGenerator(self.strip)
-
-            # Generate the PDF using rotation from settings
-            success = pdf_generator.generate_pdf(file_path)
-
-            if success:
-                QMessageBox.information(self, "PDF Generated", f"PDF has been saved to:\n{file_path}")
-            else:
-                QMessageBox.critical(
-                    self,
-                    "PDF Generation Failed",
-                    "An error occurred while generating the PDF. Please check your label strip configuration.",
-                )
+            # Render on a thread-pool worker: a multi-page PDF takes seconds
+            # for a long strip, and doing it here would freeze the GUI. The
+            # task snapshots the strip, so further edits are safe.
+            task = StripPdfExportTask(self.strip, file_path)
+            task.signals.finished.connect(self._on_pdf_generated)
+            self.generate_pdf_button.setEnabled(False)
+            # Keep the task alive until its finished signal fires.
+            self._pdf_export_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
+            self.generate_pdf_button.setEnabled(True)
             QMessageBox.critical(self, "PDF Generation Error", f"An unexpected error occurred:\n{e!s}")
 
+    @pyqtSlot(bool, str)
+    def _on_pdf_generated(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background PDF generation."""
+        self._pdf_export_task = None
+        self.generate_pdf_button.setEnabled(True)
+        if success:
+            QMessageBox.information(self, "PDF Generated", f"PDF has been saved to:\n{file_path}")
+        else:
+            QMessageBox.critical(
+                self,
+                "PDF Generation Failed",
+                "An error occurred while generating the PDF. Please check your label strip configuration.",
+            )
+
+    @pyqtSlot()
     def export_png(self) -> None:
         """Export the current strip as a PNG file."""
+        self.flush_pending_edits()
+
         # Check if there are any segments to generate
         if self.strip.get_total_width() == 0:
             QMessageBox.warning(
@@ -844,21 +1285,31 @@ class DesignerTab(QWidget):
             return  # User cancelled
 
         try:
-            # Create high-resolution renderer for PNG export
-            renderer = StripRenderer(self.strip)
-
-            # Save PNG at 300 DPI
-            success = renderer.save_to_png(file_path, dpi=300)
-
-            if success:
-                QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
-            else:
-                QMessageBox.critical(
-                    self,
-                    "PNG Export Failed",
-                    "An error occurred while exporting the PNG. Please check your label strip configuration.",
-                )
+            # Rasterize and save on a thread-pool worker: a 300 DPI export
+            # of a long strip takes seconds, and doing it here would freeze
+            # the GUI. The task snapshots the strip, so further edits are safe.
+            task = StripPngExportTask(self.strip, file_path, dpi=300)
+            task.signals.finished.connect(self._on_png_exported)
+            self.export_png_button.setEnabled(False)
+            # Keep the task alive until its finished signal fires.
+            self._png_export_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
+            self.export_png_button.setEnabled(True)
             QMessageBox.critical(self, "PNG Export Error", f"An unexpected error occurred:\n{e!s}")
+
+    @pyqtSlot(bool, str)
+    def _on_png_exported(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background PNG export."""
+        self._png_export_task = None
+        self.export_png_button.setEnabled(True)
+        if success:
+            QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
+        else:
+            QMessageBox.critical(
+                self,
+                "PNG Export Failed",
+                "An error occurred while exporting the PNG. Please check your label strip configuration.",
+            )
@@ -4,6 +4,7 @@ Main application window for the Jackfield Labeler.
 
 import os
 
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QDialog,
@@ -19,7 +20,7 @@ from PyQt6.QtWidgets import (
 )
 
 from jackfield_labeler import __version__
-from jackfield_labeler.utils import PDFGenerator, ProjectManager, StripRenderer
+from jackfield_labeler.utils import ProjectManager, StripPdfExportTask, StripPngExportTask
 from jackfield_labeler.views.designer_tab import DesignerTab
 from jackfield_labeler.views.preview_tab import PreviewTab
 from jackfield_labeler.views.settings_tab import SettingsTab
@@ -57,9 +58,10 @@ class MainWindow(QMainWindow):
         # Connect settings to designer tab
         self.settings_tab.settings_changed.connect(self._on_settings_changed)
 
-        # Connect designer changes to preview
-        self.designer_tab.control_panel.strip_changed.connect(self._update_preview)
-        self.designer_tab.segment_table.segment_changed.connect(self._update_preview)
+        # Connect designer changes to preview. strip_updated fires after
+        # the designer's deferred model sync, so the preview always renders
+        # the up-to-date strip (the raw widget signals fire before it).
+        self.designer_tab.strip_updated.connect(self._update_preview)
 
         # Add tabs to tab widget
         self.tab_widget.addTab(self.designer_tab, "🎨 Designer")
@@ -78,9 +80,13 @@ class MainWindow(QMainWindow):
         self._current_project_path: str | None = None
         self._project_modified = False
 
+        # In-flight background export tasks; the references keep them alive
+        # until their finished signals fire.
+        self._pdf_export_task: StripPdfExportTask | None = None
+        self._png_export_task: StripPngExportTask | None = None
+
         # Connect signals to track modifications
-        self.designer_tab.control_panel.strip_changed.connect(self._mark_project_modified)
-        self.designer_tab.segment_table.segment_changed.connect(self._mark_project_modified)
+        self.designer_tab.strip_updated.connect(self._mark_project_modified)
         self.settings_tab.settings_changed.connect(self._mark_project_modified)
 
         # Update window title
@@ -259,6 +265,9 @@ class MainWindow(QMainWindow):
 
     def save_project(self) -> bool:
         """Save the current label strip project."""
+        # Ctrl+S can land while an edit is still in the designer's
+        # coalescing timers; drain them before snapshotting the strip.
+        self.designer_tab.flush_pending_edits()
         if self._current_project_path is None:
             return self.save_project_as()
         return self._save_to_path(self._current_project_path)
@@ -282,6 +291,9 @@ class MainWindow(QMainWindow):
 
     def generate_pdf(self) -> None:
         """Generate a PDF from the current label strip design."""
+        # Drain any coalesced-but-unapplied edits before reading the strip.
+        self.designer_tab.flush_pending_edits()
+
         # Get the current label strip from the designer tab
         label_strip = self.designer_tab.strip
 
@@ -303,30 +315,40 @@ class MainWindow(QMainWindow):
             return  # User cancelled
 
         try:
-            # Create PDF generator
-            pdf_generator = PDFGenerator(label_strip)
-
-            # Generate the PDF using rotation from settings
-            success = pdf_generator.generate_pdf(file_path)
-
-            if success:
-                self.status_bar.showMessage(f"PDF generated successfully: {file_path}", 5000)
-                QMessageBox.information(self, "PDF Generated", f"PDF has been saved to:\n{file_path}")
-            else:
-                self.status_bar.showMessage("Failed to generate PDF", 3000)
-                QMessageBox.critical(
-                    self,
-                    "PDF Generation Failed",
-                    "An error occurred while generating the PDF. Please check your label strip configuration.",
-                )
+            # Render on a thread-pool worker so a multi-second PDF pass never
+            # freezes the GUI. The task snapshots the strip, so further edits
+            # are safe while it runs.
+            task = StripPdfExportTask(label_strip, file_path)
+            task.signals.finished.connect(self._on_pdf_generated)
+            self.status_bar.showMessage("Generating PDF...")
+            # Keep the task alive until its finished signal fires.
+            self._pdf_export_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
             self.status_bar.showMessage("Error generating PDF", 3000)
             QMessageBox.critical(self, "PDF Generation Error", f"An unexpected error occurred:\n{e!s}")
 
+    def _on_pdf_generated(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background PDF generation."""
+        self._pdf_export_task = None
+        if success:
+            self.status_bar.showMessage(f"PDF generated successfully: {file_path}", 5000)
+            QMessageBox.information(self, "PDF Generated", f"PDF has been saved to:\n{file_path}")
+        else:
+            self.status_bar.showMessage("Failed to generate PDF", 3000)
+            QMessageBox.critical(
+                self,
+                "PDF Generation Failed",
+                "An error occurred while generating the PDF. Please check your label strip configuration.",
+            )
+
     def export_png(self) -> None:
         """Export the current label strip design as a PNG file."""
+        # Drain any coalesced-but-unapplied edits before reading the strip.
+        self.designer_tab.flush_pending_edits()
+
         # Get the current label strip from the designer tab
         label_strip = self.designer_tab.strip
 
@@ -348,28 +370,35 @@ class MainWindow(QMainWindow):
             return  # User cancelled
 
         try:
-            # Create strip renderer
-            renderer = StripRenderer(label_strip)
-
-            # Export PNG at 300 DPI (no rotation - sized to strip)
-            success = renderer.save_to_png(file_path, dpi=300)
-
-            if success:
-                self.status_bar.showMessage(f"PNG exported successfully: {file_path}", 5000)
-                QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
-            else:
-                self.status_bar.showMessage("Failed to export PNG", 3000)
-                QMessageBox.critical(
-                    self,
-                    "PNG Export Failed",
-                    "An error occurred while exporting the PNG. Please check your label strip configuration.",
-                )
+            # Rasterize and save on a thread-pool worker so a 300 DPI pass
+            # over a long strip never freezes the GUI. The task snapshots
+            # the strip, so further edits are safe while it runs.
+            task = StripPngExportTask(label_strip, file_path, dpi=300)
+            task.signals.finished.connect(self._on_png_exported)
+            self.status_bar.showMessage("Exporting PNG...")
+            # Keep the task alive until its finished signal fires.
+            self._png_export_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
             self.status_bar.showMessage("Error exporting PNG", 3000)
             QMessageBox.critical(self, "PNG Export Error", f"An unexpected error occurred:\n{e!s}")
 
+    def _on_png_exported(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background PNG export."""
+        self._png_export_task = None
+        if success:
+            self.status_bar.showMessage(f"PNG exported successfully: {file_path}", 5000)
+            QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
+        else:
+            self.status_bar.showMessage("Failed to export PNG", 3000)
+            QMessageBox.critical(
+                self,
+                "PNG Export Failed",
+                "An error occurred while exporting the PNG. Please check your label strip configuration.",
+            )
+
     def show_user_guide(self) -> None:
         """Show the user guide."""
         self._show_documentation("User Guide", "docs/user-guide.md")
@@ -4,7 +4,7 @@ Preview tab for viewing label strips.
 
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtGui import QPainter, QResizeEvent
 from PyQt6.QtWidgets import (
     QFileDialog,
@@ -23,7 +23,7 @@ from PyQt6.QtWidgets import (
 
 from jackfield_labeler.models import LabelStrip
 from jackfield_labeler.utils.pdf_generator import PDFGenerator
-from jackfield_labeler.utils.strip_renderer import StripRenderer
+from jackfield_labeler.utils.strip_renderer import StripPngExportTask, StripRenderer
 
 if TYPE_CHECKING:
     from PyQt6.QtWidgets import QWidget as QWidgetType
@@ -48,6 +48,9 @@ class StripPreviewWidget(QGraphicsView):
 
         self.strip: LabelStrip | None = None
         self.pixmap_item: QGraphicsPixmapItem | None = None
+        # Kept across updates so the renderer's incremental pixmap cache
+        # survives repaints of the same strip at the same scale.
+        self._renderer: StripRenderer | None = None
 
     def update_preview(self, strip: LabelStrip) -> None:
         """Update the preview with a new label strip."""
@@ -60,7 +63,7 @@ class StripPreviewWidget(QGraphicsView):
 
         # Obtain paper dimensions in points, then convert to mm.
         # ReportLab stores page sizes in points (1 pt = 25.4/72 mm).
-        paper_size_pts = PDFGenerator.PAPER_SIZES.get(strip.settings.paper_size)
+        paper_size_pts = PDFGenerator.paper_size_pts(strip.settings.paper_size)
         if paper_size_pts is None:
             return
         pts_to_mm = 25.4 / 72.0
@@ -74,8 +77,12 @@ class StripPreviewWidget(QGraphicsView):
         scale_y = view_rect.height() / page_height_mm if page_height_mm > 0 else 1.0
         scale_mm_px = min(scale_x, scale_y) * 0.95  # px per mm
 
-        # Create renderer whose scale_factor is px/mm (matches strip dimensions)
-        renderer = StripRenderer(strip, scale_factor=scale_mm_px)
+        # Reuse the renderer (and its segment-level pixmap cache) while the
+        # strip identity and scale are stable; rebuild otherwise.
+        renderer = self._renderer
+        if renderer is None or renderer.label_strip is not strip or renderer.scale_factor != scale_mm_px:
+            renderer = StripRenderer(strip, scale_factor=scale_mm_px)
+            self._renderer = renderer
 
         # Render the strip on a page
         pixmap = renderer.render_to_pixmap_on_page(
@@ -184,6 +191,7 @@ class PreviewTab(QWidget):
 
         # Initialize state
         self.current_strip: LabelStrip | None = None
+        self._png_export_task: StripPngExportTask | None = None
 
     def update_preview(self, strip: LabelStrip) -> None:
         """Update the preview with a new label strip."""
@@ -209,21 +217,30 @@ class PreviewTab(QWidget):
             return  # User cancelled
 
         try:
-            # Create high-resolution renderer for PNG export
-            renderer = StripRenderer(self.current_strip)
-
-            # Save PNG at 300 DPI
-            success = renderer.save_to_png(file_path, dpi=300)
-
-            if success:
-                QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
-            else:
-                QMessageBox.critical(
-                    self,
-                    "PNG Export Failed",
-                    "An error occurred while exporting the PNG. Please check your label strip configuration.",
-                )
+            # Rasterize and save on a thread-pool worker: a 300 DPI export of
+            # a long strip takes seconds, and doing it here would freeze the
+            # GUI. The task snapshots the strip, so further edits are safe.
+            task = StripPngExportTask(self.current_strip, file_path, dpi=300)
+            task.signals.finished.connect(self._on_png_export_finished)
+            self.export_png_button.setEnabled(False)
+            # Keep the task alive until its finished signal fires.
+            self._png_export_task = task
+            QThreadPool.globalInstance().start(task)
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # GUI error handler - catch all exceptions to show user-friendly error
+            self.export_png_button.setEnabled(True)
             QMessageBox.critical(self, "PNG Export Error", f"An unexpected error occurred:\n{e!s}")
+
+    def _on_png_export_finished(self, success: bool, file_path: str) -> None:
+        """Report the outcome of a background PNG export."""
+        self._png_export_task = None
+        self.export_png_button.setEnabled(True)
+        if success:
+            QMessageBox.information(self, "PNG Exported", f"PNG has been saved to:\n{file_path}")
+        else:
+            QMessageBox.critical(
+                self,
+                "PNG Export Failed",
+                "An error occurred while exporting the PNG. Please check your label strip configuration.",
+            )
@@ -7,7 +7,7 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QSettings, QStandardPaths, Qt, pyqtSignal
+from PyQt6.QtCore import QStandardPaths, Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -32,6 +32,7 @@ else:
 
 from jackfield_labeler.models import Color, PaperSize, StripSettings
 from jackfield_labeler.utils.logger import configure_logging, get_logger
+from jackfield_labeler.utils.settings_cache import SettingsCache
 
 
 class ColorButton(QPushButton):
@@ -482,10 +483,9 @@ class SettingsTab(QWidget):
         # Get current logging config
         config = self.logging_group.get_logging_config()
 
-        # Save to QSettings
-        settings = QSettings()
-        settings.setValue("logging/level", config["level"])
-        settings.setValue("logging/file_enabled", config["file_enabled"])
+        # Save through the settings cache (persists only on real change)
+        SettingsCache.set("logging/level", config["level"])
+        SettingsCache.set("logging/file_enabled", config["file_enabled"])
 
         # Determine log file path
         if config["file_enabled"]:
@@ -2,7 +2,7 @@
 Tests for the Label Strip data model.
 """
 
-from jackfield_labeler.models import Color, LabelStrip, TextFormat
+from jackfield_labeler.models import Color, LabelStrip, StandardColor, TextFormat
 
 
 def test_label_strip_init():
@@ -178,3 +178,33 @@ def test_serialization():
     assert new_strip.end_segment is not None
     assert new_strip.end_segment.width == 15.0
     assert new_strip.end_segment.text == "End"
+
+
+def test_color_from_hex_caching():
+    """Test that repeated hex parses reuse the cached immutable Color."""
+    a = Color.from_hex("#FF8800")
+    b = Color.from_hex("#FF8800")
+
+    # Same instance back from the cache, with correct channel values
+    assert a is b
+    assert (a.r, a.g, a.b) == (255, 136, 0)
+
+
+def test_color_from_standard_caching():
+    """Test that standard palette lookups reuse one Color per enum value."""
+    a = Color.from_standard(StandardColor.RED)
+    b = Color.from_standard(StandardColor.RED)
+
+    assert a is b
+    assert a.to_standard() == StandardColor.RED
+
+
+def test_segments_use_slots():
+    """Test that segments carry no per-instance __dict__ (slots layout)."""
+    strip = LabelStrip()
+    strip.set_content_segment_count(1)
+    strip.set_start_segment(width=10.0, text="S")
+    strip.set_end_segment(width=10.0, text="E")
+
+    for segment in strip.get_all_segments():
+        assert not hasattr(segment, "__dict__")